@@ -1,7 +1,83 @@
-from podryk.models.enum import EpisodeType, Explicit, PodcastCategory, PodcastType
-from podryk.models.episode import Episode
-from podryk.models.podcast import Podcast
-from podryk.models.sub_types import Chapter, Enclosure, Guid, TextRecord, Transcript
+"""
+Exports are imported lazily on first access, so that `import podryk` stays fast for short-lived processes.
+Long-running services can call `warmup()` at startup to move all import and build costs out of the first request.
+"""
+
+# Not imported from `typing`, which alone takes longer to import than the rest of the package
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from podryk.batch import FeedResult as FeedResult
+    from podryk.batch import render_feeds as render_feeds
+    from podryk.cache import DiskFragmentCache as DiskFragmentCache
+    from podryk.cache import FragmentCache as FragmentCache
+    from podryk.cache import MemoryFragmentCache as MemoryFragmentCache
+    from podryk.chapters import ExternalChapters as ExternalChapters
+    from podryk.collection import EpisodeCollection as EpisodeCollection
+    from podryk.compact import CompactEpisode as CompactEpisode
+    from podryk.compact import CompactEpisodes as CompactEpisodes
+    from podryk.compression import CompressedFeed as CompressedFeed
+    from podryk.diff import EpisodeChange as EpisodeChange
+    from podryk.diff import FeedDiff as FeedDiff
+    from podryk.diff import diff_feeds as diff_feeds
+    from podryk.diff import diff_podcasts as diff_podcasts
+    from podryk.json_lines import episodes_from_json as episodes_from_json
+    from podryk.json_lines import iter_episodes_json_lines as iter_episodes_json_lines
+    from podryk.models.enum import EpisodeType as EpisodeType
+    from podryk.models.enum import Explicit as Explicit
+    from podryk.models.enum import PodcastCategory as PodcastCategory
+    from podryk.models.enum import PodcastType as PodcastType
+    from podryk.models.episode import Episode as Episode
+    from podryk.models.podcast import Podcast as Podcast
+    from podryk.models.sub_types import Chapter as Chapter
+    from podryk.models.sub_types import ChaptersLink as ChaptersLink
+    from podryk.models.sub_types import Enclosure as Enclosure
+    from podryk.models.sub_types import Guid as Guid
+    from podryk.models.sub_types import TextRecord as TextRecord
+    from podryk.models.sub_types import Transcript as Transcript
+    from podryk.paging import FeedPage as FeedPage
+    from podryk.table import EpisodeTable as EpisodeTable
+    from podryk.trimming import DroppedEpisode as DroppedEpisode
+    from podryk.trimming import TrimmedFeed as TrimmedFeed
+    from podryk.validation import InvalidEpisode as InvalidEpisode
+    from podryk.validation import PartialPodcast as PartialPodcast
+
+_EXPORTS = {
+    "Podcast": "podryk.models.podcast",
+    "Episode": "podryk.models.episode",
+    "PodcastType": "podryk.models.enum",
+    "EpisodeType": "podryk.models.enum",
+    "Explicit": "podryk.models.enum",
+    "PodcastCategory": "podryk.models.enum",
+    "Guid": "podryk.models.sub_types",
+    "Enclosure": "podryk.models.sub_types",
+    "Transcript": "podryk.models.sub_types",
+    "Chapter": "podryk.models.sub_types",
+    "ChaptersLink": "podryk.models.sub_types",
+    "TextRecord": "podryk.models.sub_types",
+    "FragmentCache": "podryk.cache",
+    "MemoryFragmentCache": "podryk.cache",
+    "DiskFragmentCache": "podryk.cache",
+    "render_feeds": "podryk.batch",
+    "FeedResult": "podryk.batch",
+    "CompressedFeed": "podryk.compression",
+    "FeedPage": "podryk.paging",
+    "diff_podcasts": "podryk.diff",
+    "diff_feeds": "podryk.diff",
+    "FeedDiff": "podryk.diff",
+    "EpisodeChange": "podryk.diff",
+    "episodes_from_json": "podryk.json_lines",
+    "iter_episodes_json_lines": "podryk.json_lines",
+    "PartialPodcast": "podryk.validation",
+    "InvalidEpisode": "podryk.validation",
+    "EpisodeCollection": "podryk.collection",
+    "CompactEpisode": "podryk.compact",
+    "CompactEpisodes": "podryk.compact",
+    "EpisodeTable": "podryk.table",
+    "ExternalChapters": "podryk.chapters",
+    "TrimmedFeed": "podryk.trimming",
+    "DroppedEpisode": "podryk.trimming",
+}
 
 __all__ = [
     "Podcast",
@@ -14,5 +90,63 @@ __all__ = [
     "Enclosure",
     "Transcript",
     "Chapter",
+    "ChaptersLink",
     "TextRecord",
+    "FragmentCache",
+    "MemoryFragmentCache",
+    "DiskFragmentCache",
+    "render_feeds",
+    "FeedResult",
+    "CompressedFeed",
+    "FeedPage",
+    "diff_podcasts",
+    "diff_feeds",
+    "FeedDiff",
+    "EpisodeChange",
+    "episodes_from_json",
+    "iter_episodes_json_lines",
+    "PartialPodcast",
+    "InvalidEpisode",
+    "EpisodeCollection",
+    "CompactEpisode",
+    "CompactEpisodes",
+    "EpisodeTable",
+    "ExternalChapters",
+    "TrimmedFeed",
+    "DroppedEpisode",
+    "warmup",
 ]
+
+
+def __getattr__(name: str) -> object:
+    import importlib
+
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
+
+def warmup() -> None:
+    """Import all exports and build the validators and XML serializers of all models now instead of on first use."""
+    from podryk.json_lines import episode_list_adapter
+    from podryk.models.xml_model import XmlModel
+
+    for name in _EXPORTS:
+        __getattr__(name)
+
+    pending = [XmlModel]
+    while pending:
+        model = pending.pop()
+        pending.extend(model.__subclasses__())
+        if model is not XmlModel:
+            model.build()
+
+    episode_list_adapter()
@@ -0,0 +1,106 @@
+import itertools
+import os
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+from podryk.models.podcast import Podcast
+
+_PENDING_PER_WORKER = 4
+"""Podcasts submitted per worker ahead of the yielded results."""
+
+
+@dataclass(frozen=True, slots=True)
+class FeedResult:
+    """Outcome of rendering a single podcast in a batch."""
+
+    index: int
+    """Position of the podcast in the input."""
+
+    feed: bytes | None = None
+    """The rendered feed, `None` if rendering failed."""
+
+    error: Exception | None = None
+    """The exception raised while validating or rendering the podcast."""
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def render_feeds(
+    podcasts: Iterable[Podcast | Mapping[str, Any]],
+    workers: int | None = None,
+    ordered: bool = True,
+    compiled: bool = False,
+    minimal_namespaces: bool = False,
+    executor: Executor | None = None,
+    max_pending: int | None = None,
+) -> Iterator[FeedResult]:
+    """
+    Validate and render many podcasts in a process pool.
+
+    Podcasts can be passed as validated `Podcast` instances or as unvalidated data (e.g. loaded from JSON).
+    The latter is cheaper to send to the worker processes, and validation then happens in parallel as well.
+
+    A failing podcast doesn't abort the batch: its `FeedResult` contains the error instead of the feed. This includes
+    errors of the executor, e.g. for podcasts that can't be sent to a worker process or when a worker process dies.
+    Results are yielded in input order, or as soon as they are completed if `ordered` is false.
+
+    An existing `executor` can be passed instead of `workers` to reuse the pool across batches.
+
+    At most `max_pending` podcasts (by default four per worker) are submitted ahead of the yielded results,
+    so `podcasts` can be a lazy iterable of any size and the results don't pile up in memory.
+    """
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    max_pending = max_pending or _PENDING_PER_WORKER * (workers or os.process_cpu_count() or 1)
+
+    try:
+        items = enumerate(podcasts)
+        # In submission order, the first one is the next result in input order
+        pending: dict[Future[FeedResult], int] = {}
+        while True:
+            for index, podcast in itertools.islice(items, max_pending - len(pending)):
+                pending[_submit(executor, index, podcast, compiled, minimal_namespaces)] = index
+            if not pending:
+                return
+
+            done = [next(iter(pending))] if ordered else wait(pending, return_when=FIRST_COMPLETED).done
+            for future in done:
+                yield _result(pending.pop(future), future)
+    finally:
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
+
+
+def _submit(
+    executor: Executor, index: int, podcast: Podcast | Mapping[str, Any], compiled: bool, minimal_namespaces: bool
+) -> Future[FeedResult]:
+    try:
+        return executor.submit(_render, index, podcast, compiled, minimal_namespaces)
+    except Exception as error:  # noqa: BLE001
+        # E.g. the pool broke while the batch was submitted
+        future = Future()
+        future.set_exception(error)
+        return future
+
+
+def _result(index: int, future: Future[FeedResult]) -> FeedResult:
+    try:
+        return future.result()
+    except Exception as error:  # noqa: BLE001
+        # Errors of the executor for the podcast, e.g. if it can't be pickled, or `BrokenProcessPool`
+        return FeedResult(index=index, error=error)
+
+
+def _render(index: int, podcast: Podcast | Mapping[str, Any], compiled: bool, minimal_namespaces: bool) -> FeedResult:
+    try:
+        if not isinstance(podcast, Podcast):
+            podcast = Podcast.model_validate(podcast)
+        return FeedResult(index=index, feed=podcast.to_feed(compiled=compiled, minimal_namespaces=minimal_namespaces))
+    except Exception as error:  # noqa: BLE001
+        # Any error fails only this podcast, and is reported in its result
+        return FeedResult(index=index, error=error)
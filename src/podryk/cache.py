@@ -0,0 +1,112 @@
+import hashlib
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from threading import Lock
+
+from pydantic import BaseModel
+
+try:
+    _VERSION = version("podryk")
+except PackageNotFoundError:
+    _VERSION = "unknown"
+
+
+def fragment_key(model: BaseModel) -> str:
+    """
+    Stable hash over the field values of a model, used to look up its serialized XML fragment.
+
+    Computed elements (like the chapters of an episode) are part of the hash as well.
+    The podryk version is included, since a different version may serialize the same values differently.
+    """
+    data = model.model_dump_json(warnings=False).encode()
+    return hashlib.sha256(f"{_VERSION}\0{type(model).__qualname__}\0".encode() + data).hexdigest()
+
+
+class FragmentCache(ABC):
+    """Storage for serialized XML fragments (e.g. `<item>` elements) keyed by `fragment_key`."""
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        """Return the cached fragment or `None` if it isn't cached."""
+
+    @abstractmethod
+    def set(self, key: str, fragment: bytes) -> None:
+        """Store a fragment."""
+
+
+class MemoryFragmentCache(FragmentCache):
+    """In-memory LRU cache that evicts the least recently used fragments once `max_bytes` is exceeded."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._fragments: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            fragment = self._fragments.get(key)
+            if fragment is not None:
+                self._fragments.move_to_end(key)
+            return fragment
+
+    def set(self, key: str, fragment: bytes) -> None:
+        if len(fragment) > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._fragments.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+
+            self._fragments[key] = fragment
+            self.size += len(fragment)
+
+            while self.size > self.max_bytes:
+                _, evicted = self._fragments.popitem(last=False)
+                self.size -= len(evicted)
+
+
+def write_atomically(path: Path, content: bytes) -> None:
+    """Write `content` to `path`, so that concurrent readers see the old or the new file but never a partial one."""
+    # Write to a temporary file in the same directory first, then move it into place
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=path.parent)
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(content)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+
+class DiskFragmentCache(FragmentCache):
+    """
+    Stores each fragment as a file below `directory`.
+
+    Entries are never evicted; clean up the directory externally if needed.
+    """
+
+    def __init__(self, directory: str | os.PathLike):
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def set(self, key: str, fragment: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomically(path, fragment)
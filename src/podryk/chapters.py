@@ -0,0 +1,94 @@
+"""
+External chapter files.
+
+Inline `<psc:chapters>` are part of every feed request, even though most clients never show them. The chapters
+can instead be written to JSON chapter files (as specified by the podcast namespace), which the feed only links to
+with `<podcast:chapters>`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from podryk.cache import write_atomically
+from podryk.collection import EpisodeCollection
+from podryk.compact import CompactEpisodes
+from podryk.models.sub_types import Chapter, ChaptersLink
+
+if TYPE_CHECKING:
+    from podryk.models.podcast import Podcast
+
+JSON_CHAPTERS_VERSION = "1.2.0"
+
+
+@dataclass(frozen=True, slots=True)
+class ExternalChapters:
+    podcast: Podcast
+    """The podcast with a `chapters_link` for every episode with chapters."""
+
+    written: list[Path] = field(default_factory=list)
+    """The chapter files that were created or changed."""
+
+
+def chapters_json(chapters: Sequence[Chapter]) -> bytes:
+    """Serialize chapters as JSON chapter file."""
+    data = {"version": JSON_CHAPTERS_VERSION, "chapters": [_chapter_data(chapter) for chapter in chapters]}
+    return json.dumps(data, ensure_ascii=False, indent=2).encode()
+
+
+def externalize_chapters(podcast: Podcast, directory: str | os.PathLike, chapters_url: str) -> ExternalChapters:
+    """
+    Write the chapters of every episode to a JSON chapter file below `directory` and link the episodes to it.
+
+    Files are named after a hash of the episode GUID. `chapters_url` is formatted with the file name to get the URL
+    the file is published at, e.g. `https://example.com/chapters/{name}`. A file is only written if its content
+    changed, so unchanged files keep their modification time (and need no upload). Files of removed episodes
+    aren't deleted.
+
+    The episodes keep their `chapters`, which are no longer rendered inline once `chapters_link` is set.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    written = []
+    episodes = []
+    for episode in podcast.episodes:
+        if episode.chapters:
+            name = f"{hashlib.sha256(str(episode.guid.guid).encode()).hexdigest()[:32]}.json"
+            if _write_if_changed(directory / name, chapters_json(episode.chapters)):
+                written.append(directory / name)
+            episode = episode.model_copy(update={"chapters_link": ChaptersLink(url=chapters_url.format(name=name))})
+        episodes.append(episode)
+
+    if not any(episode.chapters for episode in episodes):
+        return ExternalChapters(podcast=podcast)
+
+    if isinstance(podcast.episodes, (EpisodeCollection, CompactEpisodes)):
+        episodes = type(podcast.episodes)(episodes)
+    return ExternalChapters(podcast=podcast.model_copy(update={"episodes": episodes}), written=written)
+
+
+def _chapter_data(chapter: Chapter) -> dict[str, Any]:
+    data: dict[str, Any] = {"startTime": chapter.start.total_seconds(), "title": chapter.title}
+    if chapter.image is not None:
+        data["img"] = chapter.image
+    if chapter.href is not None:
+        data["url"] = chapter.href
+    return data
+
+
+def _write_if_changed(path: Path, content: bytes) -> bool:
+    try:
+        if path.read_bytes() == content:
+            return False
+    except FileNotFoundError:
+        pass
+
+    write_atomically(path, content)
+    return True
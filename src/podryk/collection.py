@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import bisect
+import itertools
+import math
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, overload
+
+from podryk.models.episode import Episode
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+NumberKey = tuple[int, int]
+"""Season (0 without a season) and episode number."""
+
+
+class EpisodeCollection(Sequence[Episode]):
+    """
+    Episodes sorted by publication date, newest first, with indexes by GUID and by season and episode number.
+
+    The position of an added episode is found by binary search, and episodes are found and replaced by their GUID
+    in constant time. Episodes without a publication date are sorted last; episodes with the same date keep the order
+    in which they were added.
+
+    A collection can be passed as `Podcast.episodes` as is. Serial podcasts (`PodcastType.SERIAL`) render the episodes
+    in episode number order instead (see `in_number_order()`).
+    """
+
+    def __init__(self, episodes: Iterable[Episode] = ()):
+        self._episodes: list[Episode] = []
+        self._by_guid: dict[str, Episode] = {}
+        self._numbered: list[Episode] = []
+        self._by_number: dict[NumberKey, Episode] = {}
+
+        for episode in episodes:
+            self.add(episode)
+
+    def __len__(self) -> int:
+        return len(self._episodes)
+
+    @overload
+    def __getitem__(self, index: int) -> Episode: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Episode]: ...
+
+    def __getitem__(self, index: int | slice) -> Episode | list[Episode]:
+        return self._episodes[index]
+
+    def __iter__(self) -> Iterator[Episode]:
+        return iter(self._episodes)
+
+    def __contains__(self, episode: Any) -> bool:
+        return isinstance(episode, Episode) and self._by_guid.get(episode_guid(episode)) == episode
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EpisodeCollection):
+            return self._episodes == other._episodes
+        return isinstance(other, Sequence) and self._episodes == list(other)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._episodes!r})"
+
+    def add(self, episode: Episode) -> Episode | None:
+        """Insert an episode at its position, or replace the episode with the same GUID. Returns the replaced one."""
+        previous = self._by_guid.get(episode_guid(episode))
+        if previous is not None:
+            self._unlink(previous)
+
+        bisect.insort_right(self._episodes, episode, key=_date_key)
+        self._by_guid[episode_guid(episode)] = episode
+
+        number_key = _number_key(episode)
+        if number_key is not None:
+            bisect.insort_right(self._numbered, episode, key=_number_key)
+            self._by_number[number_key] = episode
+
+        return previous
+
+    def remove(self, guid: str) -> Episode:
+        """Remove the episode with the GUID. Raises a `KeyError` if there is none."""
+        episode = self._by_guid[guid]
+        self._unlink(episode)
+        return episode
+
+    def get(self, guid: str) -> Episode | None:
+        """The episode with the GUID."""
+        return self._by_guid.get(guid)
+
+    def get_by_number(self, episode_number: int, season_number: int | None = None) -> Episode | None:
+        """The episode with the episode number (and season number, if the show has seasons)."""
+        return self._by_number.get((season_number or 0, episode_number))
+
+    def in_number_order(self) -> list[Episode]:
+        """Episodes sorted by season and episode number, followed by episodes without a number (newest first)."""
+        return [*self._numbered, *(episode for episode in self._episodes if _number_key(episode) is None)]
+
+    def _unlink(self, episode: Episode) -> None:
+        del self._by_guid[episode_guid(episode)]
+        _remove_sorted(self._episodes, episode, _date_key)
+
+        number_key = _number_key(episode)
+        if number_key is not None:
+            _remove_sorted(self._numbered, episode, _number_key)
+            if self._by_number.get(number_key) is episode:
+                del self._by_number[number_key]
+                # Another episode may share the number
+                position = bisect.bisect_left(self._numbered, number_key, key=_number_key)
+                if position < len(self._numbered) and _number_key(self._numbered[position]) == number_key:
+                    self._by_number[number_key] = self._numbered[position]
+
+
+def episode_guid(episode: Episode) -> str:
+    """The GUID of `episode` as a string, which identifies the episode across versions of a feed."""
+    return str(episode.guid.guid)
+
+
+def newest_first(date: datetime | None) -> float:
+    """Sort key for publication dates, newest first. Episodes without a date are considered oldest."""
+    return -date.timestamp() if date is not None else math.inf
+
+
+def _date_key(episode: Episode) -> float:
+    return newest_first(episode.publication_date)
+
+
+def _number_key(episode: Episode) -> NumberKey | None:
+    if episode.episode_number is None:
+        return None
+    return episode.season_number or 0, episode.episode_number
+
+
+def _remove_sorted(episodes: list[Episode], episode: Episode, key: Callable[[Episode], Any]) -> None:
+    """Remove `episode` (by identity) from a list sorted by `key`."""
+    start = bisect.bisect_left(episodes, key(episode), key=key)
+    end = bisect.bisect_right(episodes, key(episode), lo=start, key=key)
+    # The key of an episode that was modified after it was added no longer leads to its position
+    for position in itertools.chain(range(start, end), range(len(episodes))):
+        if episodes[position] is episode:
+            del episodes[position]
+            return
+    raise ValueError(f"Episode {episode_guid(episode)!r} isn't in the collection")
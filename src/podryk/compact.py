@@ -0,0 +1,166 @@
+"""
+Compact representation of episodes for very large catalogs.
+
+An `Episode` is a pydantic model with nested `Guid`, `Enclosure`, `Transcript` and `Chapter` models, each with its own
+instance dictionary and pydantic bookkeeping. `CompactEpisode` stores the same values flattened into a single slotted
+record, and only builds the models while an episode is accessed or rendered.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import overload
+
+from podryk.models.enum import EpisodeType
+from podryk.models.episode import Episode
+from podryk.models.sub_types import Chapter, ChaptersLink, Enclosure, Guid, Transcript
+
+TranscriptRecord = tuple[str, str, str | None]
+"""URL, media type and language of a transcript."""
+
+ChapterRecord = tuple[float, str, str | None, str | None]
+"""Start in seconds, title, link and image of a chapter."""
+
+ChaptersLinkRecord = tuple[str, str]
+"""URL and media type of an external chapters file."""
+
+
+@dataclass(frozen=True, slots=True)
+class CompactEpisode:
+    """The fields of a validated `Episode` in a single slotted record, without nested models."""
+
+    title: str
+    guid: str | uuid.UUID
+    guid_is_permalink: bool | None
+    enclosure_url: str
+    enclosure_length: int
+    enclosure_type: str
+    link: str | None = None
+    publication_date: datetime | None = None
+    description: str | None = None
+    duration: float | None = None
+    """Duration in seconds."""
+    image: str | None = None
+    explicit: bool | None = None
+    season_number: int | None = None
+    episode_number: int | None = None
+    type: EpisodeType | None = None
+    block: bool | None = None
+    transcripts: tuple[TranscriptRecord, ...] | None = None
+    chapters: tuple[ChapterRecord, ...] | None = None
+    chapters_link: ChaptersLinkRecord | None = None
+
+    @classmethod
+    def from_episode(cls, episode: Episode) -> CompactEpisode:
+        return cls(
+            title=episode.title,
+            guid=episode.guid.guid,
+            guid_is_permalink=episode.guid.is_permalink,
+            enclosure_url=episode.enclosure.url,
+            enclosure_length=episode.enclosure.length,
+            enclosure_type=episode.enclosure.type,
+            link=episode.link,
+            publication_date=episode.publication_date,
+            description=episode.description,
+            duration=_seconds(episode.duration),
+            image=episode.image,
+            explicit=episode.explicit,
+            season_number=episode.season_number,
+            episode_number=episode.episode_number,
+            type=episode.type,
+            block=episode.block,
+            transcripts=tuple(
+                (transcript.url, transcript.type, transcript.language) for transcript in episode.transcripts
+            )
+            if episode.transcripts is not None
+            else None,
+            chapters=tuple(
+                (_seconds(chapter.start), chapter.title, chapter.href, chapter.image) for chapter in episode.chapters
+            )
+            if episode.chapters is not None
+            else None,
+            chapters_link=(episode.chapters_link.url, episode.chapters_link.type)
+            if episode.chapters_link is not None
+            else None,
+        )
+
+    def to_episode(self) -> Episode:
+        """Build the `Episode` again. The values were validated before, so they aren't validated again."""
+        return Episode.model_construct(
+            title=self.title,
+            enclosure=Enclosure.model_construct(
+                url=self.enclosure_url, length=self.enclosure_length, type=self.enclosure_type
+            ),
+            guid=Guid.model_construct(is_permalink=self.guid_is_permalink, guid=self.guid),
+            link=self.link,
+            publication_date=self.publication_date,
+            description=self.description,
+            duration=_timedelta(self.duration),
+            image=self.image,
+            explicit=self.explicit,
+            season_number=self.season_number,
+            episode_number=self.episode_number,
+            type=self.type,
+            block=self.block,
+            transcripts=[
+                Transcript.model_construct(url=url, type=media_type, language=language)
+                for url, media_type, language in self.transcripts
+            ]
+            if self.transcripts is not None
+            else None,
+            chapters=[
+                Chapter.model_construct(start=_timedelta(start), title=title, href=href, image=image)
+                for start, title, href, image in self.chapters
+            ]
+            if self.chapters is not None
+            else None,
+            chapters_link=ChaptersLink.model_construct(url=self.chapters_link[0], type=self.chapters_link[1])
+            if self.chapters_link is not None
+            else None,
+        )
+
+
+class CompactEpisodes(Sequence[Episode]):
+    """
+    Episodes stored as `CompactEpisode` records.
+
+    Accessing an episode builds a new `Episode`, which isn't kept. The sequence can be passed as `Podcast.episodes`;
+    render it with `Podcast.write_feed()` or `Podcast.iter_feed_chunks()`, so that only a single `Episode` exists
+    at a time.
+    """
+
+    def __init__(self, episodes: Iterable[Episode | CompactEpisode] = ()):
+        self.records: list[CompactEpisode] = []
+        for episode in episodes:
+            self.append(episode)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @overload
+    def __getitem__(self, index: int) -> Episode: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Episode]: ...
+
+    def __getitem__(self, index: int | slice) -> Episode | list[Episode]:
+        if isinstance(index, slice):
+            return [record.to_episode() for record in self.records[index]]
+        return self.records[index].to_episode()
+
+    def __iter__(self) -> Iterator[Episode]:
+        return (record.to_episode() for record in self.records)
+
+    def append(self, episode: Episode | CompactEpisode) -> None:
+        self.records.append(episode if isinstance(episode, CompactEpisode) else CompactEpisode.from_episode(episode))
+
+
+def _seconds(value: timedelta | None) -> float | None:
+    return None if value is None else value.total_seconds()
+
+
+def _timedelta(seconds: float | None) -> timedelta | None:
+    return None if seconds is None else timedelta(seconds=seconds)
@@ -0,0 +1,308 @@
+"""
+Fast-path XML serialization for podryk models.
+
+pydantic-xml serializes a model by first converting the whole model into JSON-compatible python objects and then
+running a generic serializer per field. For the fixed set of models in podryk, this module walks the field metadata
+once per model and builds a flat emission plan (tag, namespace, converter), which is then used to build the lxml tree
+directly. The resulting XML is identical to `model.to_xml_tree(exclude_none=True, skip_empty=True)`.
+
+Since values are only read as attributes, objects that aren't models (like the rows of `podryk.table.EpisodeTable`)
+can be serialized as well. They name the model whose plan is used in their `__podryk_model__` attribute.
+
+The same plans tell which namespaces a serialized model uses (`used_namespaces()`) without building the tree.
+
+The plans are built from internals of pydantic-xml (the entity info of the fields and the namespace map of the models),
+which is why the supported pydantic-xml versions are bounded. Building a plan fails with a `RuntimeError` if the
+installed version doesn't provide them.
+"""
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from enum import Enum, auto
+from functools import cache
+from importlib.metadata import version
+from typing import Any
+
+from lxml import etree
+from lxml.etree import CDATA
+from pydantic import PlainSerializer
+from pydantic_xml import BaseXmlModel, XmlFieldSerializer
+
+try:
+    from pydantic_xml.fields import extract_field_xml_entity_info
+    from pydantic_xml.typedefs import EntityLocation
+except ImportError as error:
+    raise ImportError(f"Unsupported pydantic-xml version {version('pydantic-xml')}: {error}") from error
+
+from podryk.models.annotations import annotation_metadata, find_model
+from podryk.models.field_types import _string_to_cdata
+
+_NsMap = tuple[tuple[str, str], ...]
+
+
+class _Kind(Enum):
+    TEXT = auto()
+    """Text content of the model element itself."""
+
+    ATTRIBUTE = auto()
+    ELEMENT = auto()
+    """Sub-element with text content."""
+
+    CDATA = auto()
+    """Sub-element with text content wrapped in a CDATA section."""
+
+    WRAPPED_ATTRIBUTE = auto()
+    """Attribute of a wrapping sub-element."""
+
+    MODEL = auto()
+    """Sub-element (or list of sub-elements) serialized from another model."""
+
+
+@dataclass(frozen=True, slots=True)
+class _Emission:
+    kind: _Kind
+    field_name: str
+    name: str | None = None
+    """Qualified tag or attribute name."""
+
+    wrapper: str | None = None
+    """Qualified tag of the wrapping element."""
+
+    convert: Callable[[Any], Any] | None = None
+    context: _NsMap = ()
+    """Namespace map in scope for the sub-model."""
+
+
+@dataclass(frozen=True, slots=True)
+class _Plan:
+    tag: str
+    nsmap: dict[str | None, str] | None
+    """Namespace declarations that aren't already in scope of the parent element."""
+
+    emissions: tuple[_Emission, ...]
+
+
+def to_xml_tree(model: BaseXmlModel | Any) -> etree._Element:
+    """Serialize a model to an lxml element, equivalent to `model.to_xml_tree(exclude_none=True, skip_empty=True)`."""
+    return _write(model, _plan(_model_type(model), None, ()))
+
+
+def used_namespaces(models: Iterable[BaseXmlModel | Any]) -> set[str]:
+    """The URIs of the namespaces of all elements and attributes that serializing the models would produce."""
+    uris: set[str | None] = set()
+    for model in models:
+        plan = _plan(_model_type(model), None, ())
+        _collect_namespaces(model, plan, uris)
+        uris.add(_namespace(plan.tag))
+    uris.discard(None)
+    return uris
+
+
+def _model_type(model: BaseXmlModel | Any) -> type[BaseXmlModel]:
+    return type(model) if isinstance(model, BaseXmlModel) else model.__podryk_model__
+
+
+def _write(model: BaseXmlModel, plan: _Plan, parent: etree._Element | None = None) -> etree._Element | None:
+    if parent is None:
+        element = etree.Element(plan.tag, nsmap=plan.nsmap)
+    else:
+        element = etree.SubElement(parent, plan.tag, nsmap=plan.nsmap)
+
+    for emission in plan.emissions:
+        value = getattr(model, emission.field_name)
+        if value is None:
+            continue
+
+        match emission.kind:
+            case _Kind.TEXT:
+                element.text = _encode(value, emission.convert)
+            case _Kind.ATTRIBUTE:
+                element.set(emission.name, _encode(value, emission.convert))
+            case _Kind.ELEMENT:
+                text = _encode(value, emission.convert)
+                if text:
+                    etree.SubElement(element, emission.name).text = text
+            case _Kind.CDATA:
+                if value:
+                    # noinspection PyTypeChecker
+                    etree.SubElement(element, emission.name).text = CDATA(value)
+            case _Kind.WRAPPED_ATTRIBUTE:
+                etree.SubElement(element, emission.wrapper).set(emission.name, _encode(value, emission.convert))
+            case _Kind.MODEL:
+                for sub_model in value if isinstance(value, (list, tuple)) else (value,):
+                    sub_plan = _plan(_model_type(sub_model), emission.name, emission.context)
+                    _write(sub_model, sub_plan, element)
+
+    if parent is not None and not len(element) and not element.text and not element.attrib:
+        parent.remove(element)
+        return None
+
+    return element
+
+
+def _collect_namespaces(model: BaseXmlModel, plan: _Plan, uris: set[str | None]) -> bool:
+    """
+    Add the namespaces used inside the element of `plan` to `uris`, following the same rules as `_write()`.
+
+    Returns whether the element has any content, i.e. whether it is kept when it is nested in another element.
+    """
+    has_content = False
+    for emission in plan.emissions:
+        value = getattr(model, emission.field_name)
+        if value is None:
+            continue
+
+        match emission.kind:
+            case _Kind.TEXT:
+                has_content |= bool(_encode(value, emission.convert))
+            case _Kind.ATTRIBUTE:
+                uris.add(_namespace(emission.name))
+                has_content = True
+            case _Kind.ELEMENT:
+                if _encode(value, emission.convert):
+                    uris.add(_namespace(emission.name))
+                    has_content = True
+            case _Kind.CDATA:
+                if value:
+                    uris.add(_namespace(emission.name))
+                    has_content = True
+            case _Kind.WRAPPED_ATTRIBUTE:
+                uris.update((_namespace(emission.wrapper), _namespace(emission.name)))
+                has_content = True
+            case _Kind.MODEL:
+                for sub_model in value if isinstance(value, (list, tuple)) else (value,):
+                    sub_plan = _plan(_model_type(sub_model), emission.name, emission.context)
+                    if _collect_namespaces(sub_model, sub_plan, uris):
+                        uris.add(_namespace(sub_plan.tag))
+                        has_content = True
+
+    return has_content
+
+
+def _namespace(name: str) -> str | None:
+    """The URI of a qualified name like `{uri}tag`."""
+    return name[1 : name.index("}")] if name.startswith("{") else None
+
+
+def _encode(value: Any, convert: Callable[[Any], Any] | None) -> str:
+    """Same conversion as pydantic-xml: apply the field serializer, then format the primitive value."""
+    if convert is not None:
+        value = convert(value)
+
+    if value is None:
+        return ""
+    elif isinstance(value, bool):
+        return "true" if value else "false"
+    elif isinstance(value, Enum):
+        return str(value.value)
+    else:
+        return str(value)
+
+
+@cache
+def _plan(model: type[BaseXmlModel], name: str | None, context: _NsMap) -> _Plan:
+    """
+    Build the emission plan for a model.
+
+    `name` is the qualified tag the parent assigned to the element (`None` for the root element),
+    `context` the namespace map in scope of the parent element.
+    """
+    try:
+        return _build_plan(model, name, context)
+    except AttributeError as error:
+        raise RuntimeError(
+            f"Unsupported pydantic-xml version {version('pydantic-xml')}, can't build the plan for {model.__name__}: "
+            f"{error}"
+        ) from error
+
+
+def _build_plan(model: type[BaseXmlModel], name: str | None, context: _NsMap) -> _Plan:
+    # Like pydantic-xml, names inside a model are only resolved with the namespace map declared on the model itself
+    model_nsmap = model.__xml_nsmap__ or {}
+    parent_nsmap = dict(context)
+    scope = {**parent_nsmap, **model_nsmap}
+    declarations = {prefix: uri for prefix, uri in scope.items() if parent_nsmap.get(prefix) != uri}
+
+    emissions = []
+    for field_name, field in model.model_fields.items():
+        if field.exclude:
+            continue
+
+        # Merges all entities of the field like pydantic-xml does, e.g. the inner attribute of `wrapped()` fields
+        entity = extract_field_xml_entity_info(field)
+        emissions.append(
+            _field_emission(model, field_name, field.annotation, field.metadata, entity, tuple(scope.items()))
+        )
+
+    for field_name, field in model.model_computed_fields.items():
+        emissions.append(_field_emission(model, field_name, field.return_type, [], field, tuple(scope.items())))
+
+    return _Plan(
+        tag=name or _qualify(model.__xml_tag__ or model.__name__, model.__xml_ns__, model_nsmap),
+        nsmap={prefix or None: uri for prefix, uri in declarations.items()} or None,
+        emissions=tuple(emissions),
+    )
+
+
+def _field_emission(
+    model: type[BaseXmlModel],
+    field_name: str,
+    annotation: Any,
+    metadata: list[Any],
+    entity: Any,
+    scope: _NsMap,
+) -> _Emission:
+    metadata = [*metadata, *annotation_metadata(annotation)]
+    location = getattr(entity, "location", None)
+    path = getattr(entity, "path", None)
+    entity_ns = getattr(entity, "ns", None)
+    model_nsmap = model.__xml_nsmap__ or {}
+    sub_model = find_model(annotation)
+
+    convert = next((item.func for item in metadata if isinstance(item, PlainSerializer)), None)
+    field_serializer = next((item.func for item in metadata if isinstance(item, XmlFieldSerializer)), None)
+
+    if field_serializer is _string_to_cdata:
+        return _Emission(_Kind.CDATA, field_name, name=field_name)
+    elif field_serializer is not None:
+        raise TypeError(f"Unsupported field serializer for {model.__name__}.{field_name}: {field_serializer}")
+
+    if sub_model is not None:
+        ns = entity_ns or sub_model.__xml_ns__ or model.__xml_ns__
+        sub_nsmap = {**model_nsmap, **(sub_model.__xml_nsmap__ or {})}
+        name = _qualify(path or sub_model.__xml_tag__ or field_name, ns, sub_nsmap)
+        return _Emission(_Kind.MODEL, field_name, name=name, context=scope)
+
+    if location is None:
+        return _Emission(_Kind.TEXT, field_name, convert=convert)
+    elif location == EntityLocation.ATTRIBUTE:
+        name = _qualify(path or field_name, entity_ns, model_nsmap, is_attribute=True)
+        return _Emission(_Kind.ATTRIBUTE, field_name, name=name, convert=convert)
+    elif location == EntityLocation.ELEMENT:
+        name = _qualify(path or field_name, entity_ns or model.__xml_ns__, model_nsmap)
+        return _Emission(_Kind.ELEMENT, field_name, name=name, convert=convert)
+    elif location == EntityLocation.WRAPPED and entity.wrapped.location == EntityLocation.ATTRIBUTE:
+        inner = entity.wrapped
+        return _Emission(
+            _Kind.WRAPPED_ATTRIBUTE,
+            field_name,
+            name=_qualify(inner.path or field_name, inner.ns, model_nsmap, is_attribute=True),
+            wrapper=_qualify(path, entity_ns or model.__xml_ns__, model_nsmap),
+            convert=convert,
+        )
+
+    raise TypeError(f"Unsupported XML entity for {model.__name__}.{field_name}: {entity}")
+
+
+def _qualify(tag: str, ns: str | None, nsmap: dict[str, str], is_attribute: bool = False) -> str:
+    """Same name resolution as pydantic-xml, which leaves names unqualified when the model declares no `nsmap`."""
+    if is_attribute and ns is None:
+        return tag
+
+    if ns is None:
+        uri = nsmap.get("")
+    elif not nsmap:
+        uri = None
+    else:
+        uri = nsmap[ns]
+    return f"{{{uri}}}{tag}" if uri else tag
@@ -0,0 +1,132 @@
+import hashlib
+import zlib
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import format_datetime
+from typing import Protocol
+
+# Optional compression libraries, only used if installed.
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+try:
+    from compression import zstd
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:
+        zstd = None
+
+
+class _Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+class _Identity:
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class _Brotli:
+    def __init__(self):
+        self._compressor = brotli.Compressor()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+def _zstd_compressor() -> _Compressor:
+    if hasattr(zstd, "ZstdCompressor") and hasattr(zstd.ZstdCompressor, "compressobj"):
+        return zstd.ZstdCompressor().compressobj()
+    return zstd.ZstdCompressor()
+
+
+_COMPRESSORS: dict[str, Callable[[], _Compressor] | None] = {
+    "identity": _Identity,
+    # wbits with an offset of 16 writes a gzip header (with a zero timestamp, so the output is deterministic)
+    "gzip": lambda: zlib.compressobj(9, zlib.DEFLATED, 16 + zlib.MAX_WBITS),
+    "br": _Brotli if brotli else None,
+    "zstd": _zstd_compressor if zstd else None,
+}
+
+
+def available_encodings() -> list[str]:
+    """Content encodings that can be used for compressed feeds in the current environment."""
+    return [encoding for encoding, compressor in _COMPRESSORS.items() if compressor is not None]
+
+
+@dataclass(frozen=True, slots=True)
+class CompressedFeed:
+    """A rendered feed with everything needed to serve it with HTTP caching headers."""
+
+    content: bytes
+    """The feed compressed with `encoding`."""
+
+    encoding: str
+    """HTTP content encoding: `identity`, `gzip`, `br` or `zstd`."""
+
+    content_hash: str
+    """SHA-256 hex digest of the uncompressed feed."""
+
+    last_modified: datetime | None
+    """Publication date of the newest episode."""
+
+    @property
+    def etag(self) -> str:
+        """Strong ETag, distinct for every content encoding of the same feed."""
+        if self.encoding == "identity":
+            return f'"{self.content_hash}"'
+        return f'"{self.content_hash}-{self.encoding}"'
+
+    @property
+    def headers(self) -> dict[str, str]:
+        headers = {
+            "Content-Type": "application/rss+xml; charset=utf-8",
+            "ETag": self.etag,
+            "Vary": "Accept-Encoding",
+        }
+        if self.encoding != "identity":
+            headers["Content-Encoding"] = self.encoding
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified.astimezone(UTC), usegmt=True)
+        return headers
+
+
+def compress_feed(chunks: Iterable[bytes], encoding: str, last_modified: datetime | None = None) -> CompressedFeed:
+    """Compress and hash the chunks of a feed in a single pass."""
+    if encoding not in _COMPRESSORS:
+        raise ValueError(f"Unknown content encoding {encoding}, expected one of {list(_COMPRESSORS)}")
+
+    create_compressor = _COMPRESSORS[encoding]
+    if create_compressor is None:
+        raise ValueError(f"Content encoding {encoding} requires an optional library that isn't installed")
+
+    compressor = create_compressor()
+    content_hash = hashlib.sha256()
+    parts = []
+
+    for chunk in chunks:
+        content_hash.update(chunk)
+        parts.append(compressor.compress(chunk))
+    parts.append(compressor.flush())
+
+    return CompressedFeed(
+        content=b"".join(parts),
+        encoding=encoding,
+        content_hash=content_hash.hexdigest(),
+        last_modified=last_modified,
+    )
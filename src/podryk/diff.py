@@ -0,0 +1,70 @@
+from dataclasses import dataclass, field
+
+from pydantic import BaseModel
+
+from podryk.collection import episode_guid
+from podryk.models.episode import Episode
+from podryk.models.podcast import Podcast
+from podryk.parsing import FeedSource
+
+
+@dataclass(frozen=True, slots=True)
+class EpisodeChange:
+    old: Episode
+    new: Episode
+    fields: list[str]
+    """Names of the fields that differ."""
+
+
+@dataclass(frozen=True, slots=True)
+class FeedDiff:
+    """Differences between two versions of a podcast, with episodes matched by their GUID."""
+
+    channel_fields: list[str] = field(default_factory=list)
+    """Names of the podcast fields (besides episodes) that differ."""
+
+    added: list[Episode] = field(default_factory=list)
+    removed: list[Episode] = field(default_factory=list)
+    modified: list[EpisodeChange] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.channel_fields or self.added or self.removed or self.modified)
+
+
+def diff_podcasts(old: Podcast, new: Podcast) -> FeedDiff:
+    """
+    Compare two podcasts in linear time.
+
+    Episodes are indexed by `Guid.guid`. Added and modified episodes are listed in the order of `new`,
+    removed episodes in the order of `old`. If GUIDs aren't unique, the last episode with a GUID is used.
+    """
+    old_episodes = {episode_guid(episode): episode for episode in old.episodes}
+    new_guids = set()
+
+    added, modified = [], []
+    for episode in new.episodes:
+        guid = episode_guid(episode)
+        new_guids.add(guid)
+
+        previous = old_episodes.get(guid)
+        if previous is None:
+            added.append(episode)
+        elif previous != episode:
+            modified.append(EpisodeChange(old=previous, new=episode, fields=_changed_fields(previous, episode)))
+
+    return FeedDiff(
+        channel_fields=_changed_fields(old, new, exclude=("episodes",)),
+        added=added,
+        removed=[episode for guid, episode in old_episodes.items() if guid not in new_guids],
+        modified=modified,
+    )
+
+
+def diff_feeds(old: FeedSource, new: FeedSource) -> FeedDiff:
+    """Compare two RSS feeds. The feeds are parsed incrementally, without building either XML tree."""
+    return diff_podcasts(Podcast.from_feed(old), Podcast.from_feed(new))
+
+
+def _changed_fields(old: BaseModel, new: BaseModel, exclude: tuple[str, ...] = ()) -> list[str]:
+    return [name for name in type(old).model_fields if name not in exclude and getattr(old, name) != getattr(new, name)]
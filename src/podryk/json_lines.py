@@ -0,0 +1,51 @@
+"""
+Validate episodes directly from JSON bytes.
+
+pydantic-core parses the JSON and validates it in one pass, so no intermediate dictionaries are built with `json.loads`.
+All custom field types accept their JSON representation: durations as seconds, UUIDs as strings,
+dates as ISO 8601 strings and podcast categories by member name (e.g. `"TECHNOLOGY"`).
+"""
+
+import io
+import os
+from collections.abc import Iterator
+from functools import cache
+from typing import IO
+
+from pydantic import TypeAdapter
+
+from podryk.models.episode import Episode
+
+JsonLinesSource = str | os.PathLike | bytes | IO[bytes]
+"""A file path, the JSON Lines content, or a binary file object."""
+
+
+@cache
+def episode_list_adapter() -> TypeAdapter[list[Episode]]:
+    """Built on first use, like the validators of the models."""
+    return TypeAdapter(list[Episode])
+
+
+def episodes_from_json(data: str | bytes) -> list[Episode]:
+    """Validate a JSON array of episodes."""
+    return episode_list_adapter().validate_json(data)
+
+
+def iter_episodes_json_lines(source: JsonLinesSource) -> Iterator[Episode]:
+    """
+    Validate a JSON Lines document (one episode object per line) and yield each episode as soon as it is validated.
+
+    Only a single line is held in memory at a time. Blank lines are skipped.
+    A `ValidationError` for an invalid line ends the iteration.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            yield from _iter_lines(file)
+    else:
+        yield from _iter_lines(io.BytesIO(source) if isinstance(source, bytes) else source)
+
+
+def _iter_lines(file: IO[bytes]) -> Iterator[Episode]:
+    for line in file:
+        if line.strip():
+            yield Episode.model_validate_json(line)
@@ -0,0 +1,26 @@
+import types
+import typing
+from typing import Annotated, Any
+
+from pydantic import BaseModel
+
+
+def annotation_metadata(annotation: Any) -> list[Any]:
+    """Collect `Annotated` metadata nested in optional types (e.g. `DateTime | None`)."""
+    if typing.get_origin(annotation) is Annotated:
+        return [*annotation.__metadata__, *annotation_metadata(typing.get_args(annotation)[0])]
+    elif typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        return [item for argument in typing.get_args(annotation) for item in annotation_metadata(argument)]
+    return []
+
+
+def find_model(annotation: Any) -> type[BaseModel] | None:
+    """Find the model class in annotations like `Model`, `Model | None` or `list[Model] | None`."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+
+    for argument in typing.get_args(annotation):
+        model = find_model(argument)
+        if model is not None:
+            return model
+    return None
@@ -37,6 +37,15 @@ class AtomLinkRel(StrEnum):
     ENCLOSURE = auto()
     VIA = auto()
 
+    # Feed paging and archiving (RFC 5005)
+    CURRENT = auto()
+    FIRST = auto()
+    LAST = auto()
+    NEXT = auto()
+    PREVIOUS = auto()
+    PREV_ARCHIVE = "prev-archive"
+    NEXT_ARCHIVE = "next-archive"
+
 
 @unique
 class PodcastCategory(Enum):
@@ -172,3 +181,32 @@ class PodcastCategory(Enum):
     def __init__(self, category: str | None, sub_category: str):
         self.category = category
         self.sub_category = sub_category
+
+    @classmethod
+    def from_names(cls, category: str, sub_category: str | None = None) -> "PodcastCategory":
+        """Look up a category by its names, e.g. `PodcastCategory.from_names("Arts", "Books")`."""
+        try:
+            return _CATEGORIES_BY_NAMES[category, sub_category]
+        except KeyError:
+            names = category if sub_category is None else f"{category} / {sub_category}"
+            raise ValueError(f"Unknown podcast category: {names}") from None
+
+    @property
+    def parent(self) -> "PodcastCategory | None":
+        """The top-level category of a sub-category, `None` for top-level categories."""
+        return None if self.sub_category is None else _CATEGORIES_BY_NAMES[self.category, None]
+
+    @property
+    def children(self) -> tuple["PodcastCategory", ...]:
+        """The sub-categories of a top-level category."""
+        return _SUB_CATEGORIES.get(self, ())
+
+
+_CATEGORIES_BY_NAMES: dict[tuple[str, str | None], PodcastCategory] = {
+    (member.category, member.sub_category): member for member in PodcastCategory
+}
+_SUB_CATEGORIES: dict[PodcastCategory, tuple[PodcastCategory, ...]] = {
+    parent: tuple(member for member in PodcastCategory if member.parent is parent)
+    for parent in PodcastCategory
+    if parent.sub_category is None
+}
@@ -1,6 +1,6 @@
 from datetime import timedelta
 
-from pydantic import Field, PositiveInt
+from pydantic import Field, PositiveInt, field_validator
 from pydantic_xml import attr, computed_element, element, wrapped
 
 from podryk.models.enum import EpisodeType
@@ -9,16 +9,19 @@ from podryk.models.field_types import (
     CData,
     DateTime,
     DurationInSeconds,
+    InternedURL,
     YesBool,
 )
 from podryk.models.namespaces import NAMESPACES, Namespace
 from podryk.models.sub_types import (
     Chapter,
     Chapters,
+    ChaptersLink,
     Enclosure,
     Guid,
     Transcript,
 )
+from podryk.models.validators import FLYWEIGHTS
 from podryk.models.xml_model import XmlModel
 
 
@@ -66,7 +69,7 @@ class Episode(XmlModel, tag="item", nsmap=NAMESPACES):
     duration: DurationInSeconds[timedelta | None] = element(ns=Namespace.ITUNES, default=None)
     """The duration of a podcast episode in seconds."""
 
-    image: URL | None = wrapped(
+    image: InternedURL | None = wrapped(
         "image",
         ns=Namespace.ITUNES,
         entity=attr(name="href", default=None),
@@ -109,10 +112,23 @@ class Episode(XmlModel, tag="item", nsmap=NAMESPACES):
     transcripts: list[Transcript] | None = element(default=None)
     """A link to a transcript or closed captions file. Multiple tags can be present for multiple formats."""
 
+    chapters_link: ChaptersLink | None = element(default=None)
+    """
+    A link to the chapters in an external file.
+
+    If set, `chapters` aren't rendered inline. See `podryk.chapters` for writing the chapter files.
+    """
+
     # Fields from podlove namespace
 
     chapters: list[Chapter] | None = Field(exclude=True, default=None)
 
+    @field_validator("transcripts")
+    @classmethod
+    def share_transcripts(cls, transcripts: list[Transcript] | None) -> list[Transcript] | None:
+        """Equal transcripts (e.g. of re-published episodes) share a single instance."""
+        return FLYWEIGHTS.share_all(transcripts)
+
     @computed_element
     def _chapters(self) -> Chapters | None:
-        return Chapters(chapters=self.chapters) if self.chapters else None
+        return Chapters(chapters=self.chapters) if self.chapters and self.chapters_link is None else None
@@ -3,7 +3,6 @@ from email.utils import format_datetime
 from typing import Annotated, TypeVar
 from uuid import UUID
 
-import content_types
 from lxml.etree import CDATA
 from pydantic import (
     AfterValidator,
@@ -16,6 +15,9 @@ from pydantic import (
 from pydantic_xml import BaseXmlModel, XmlFieldSerializer
 from pydantic_xml.element import XmlElementWriter
 
+from podryk.models.enum import PodcastCategory
+from podryk.models.validators import intern_string, is_media_type
+
 
 def _bool_to_yes_no(value: bool | None) -> str:
     return "yes" if value else "no"
@@ -51,6 +53,20 @@ def _convert_uuid(value: UUID | str | None) -> UUID | None:
         return value
 
 
+def _convert_podcast_category(value: PodcastCategory | str | list | tuple) -> PodcastCategory | tuple:
+    """
+    Accept categories by member name (e.g. `"TECHNOLOGY"`), by the name of a top-level category (e.g. `"Technology"`),
+    and as JSON arrays of names (e.g. `["Arts", "Books"]`).
+    """
+    if isinstance(value, str):
+        member = PodcastCategory.__members__.get(value)
+        return member if member is not None else PodcastCategory.from_names(value)
+    elif isinstance(value, (list, tuple)) and len(value) == 2:
+        return PodcastCategory.from_names(*value)
+    else:
+        return value
+
+
 def _timedelta_to_npt(value: timedelta | None) -> str | None:
     """Format a timedelta as a Normal Play Time (HH:MM:SS.mmm)."""
     if value is None:
@@ -70,10 +86,7 @@ def _datetime_to_rfc2822_string(value: datetime | None) -> str | None:
 
 
 def _validate_media_type(media_type: str | None) -> str:
-    if (
-        media_type
-        and media_type not in content_types.EXTENSION_TO_CONTENT_TYPE.values()
-    ):
+    if media_type and not is_media_type(media_type):
         raise ValueError(f"{media_type} not a recognized media type")
     return media_type
 
@@ -124,7 +137,11 @@ _UUIDv5Type = TypeVar("_UUIDv5Type", UUID | str, UUID | str, default=UUID | str)
 URL = Annotated[str, HttpUrl]
 YesNoBool = Annotated[_BoolType, PlainSerializer(_bool_to_yes_no)]
 YesBool = Annotated[_BoolType, PlainSerializer(_bool_to_yes)]
-MediaType = Annotated[_StringType, AfterValidator(_validate_media_type)]
+MediaType = Annotated[_StringType, AfterValidator(_validate_media_type), AfterValidator(intern_string)]
+InternedString = Annotated[_StringType, AfterValidator(intern_string)]
+"""A string that repeats across many episodes, e.g. a language. Equal values share a single object."""
+InternedURL = Annotated[str, HttpUrl, AfterValidator(intern_string)]
+"""A URL that repeats across many episodes, e.g. the image of a show. Equal values share a single object."""
 CData = Annotated[
     _StringType,
     XmlFieldSerializer(_string_to_cdata),
@@ -154,3 +171,4 @@ UUIDv5 = Annotated[
     # can't use pydantic.types.UuidVersion(5) because it doesn't support nullable types
     AfterValidator(_check_uuid_v5),
 ]
+AppleCategory = Annotated[PodcastCategory, BeforeValidator(_convert_podcast_category)]
@@ -1,21 +1,59 @@
-from typing import List
+import hashlib
+import itertools
+import os
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Annotated, Any, BinaryIO
 from uuid import UUID
 
-from pydantic import Field
+from lxml import etree
+from pydantic import (
+    Field,
+    GetPydanticSchema,
+    SerializerFunctionWrapHandler,
+    ValidatorFunctionWrapHandler,
+    field_serializer,
+    field_validator,
+)
 from pydantic_xml import BaseXmlModel, attr, computed_element, element, wrapped
 
+from podryk.collection import EpisodeCollection, newest_first
+from podryk.compact import CompactEpisodes
 from podryk.models.enum import PodcastCategory, PodcastType
 from podryk.models.episode import Episode
-from podryk.models.field_types import URL, CData, Language, UUIDv5, YesBool, YesNoBool
+from podryk.models.field_types import URL, AppleCategory, CData, Language, UUIDv5, YesBool, YesNoBool
 from podryk.models.namespaces import NAMESPACES, Namespace
 from podryk.models.sub_types import AtomLink, Category, TextRecord
+from podryk.models.validators import FLYWEIGHTS
 from podryk.models.xml_model import XmlModel
+from podryk.table import EpisodeTable
+from podryk.validation import check_unique_episodes
+
+if TYPE_CHECKING:
+    # Features that aren't needed to validate and render a podcast are imported on first use
+    from podryk.cache import FragmentCache
+    from podryk.chapters import ExternalChapters
+    from podryk.compression import CompressedFeed
+    from podryk.paging import FeedPage
+    from podryk.parsing import FeedSource
+    from podryk.trimming import TrimmedFeed
+    from podryk.validation import PartialPodcast
+
+EpisodeSequence = Annotated[Sequence[Episode], GetPydanticSchema(lambda _, handler: handler(list[Episode]))]
+"""
+Episodes as any sequence. pydantic-xml only supports lists, so the field is validated and serialized like a list
+(with the sequences that `Podcast` accepts as is passed through by `Podcast.keep_episode_collection`).
+"""
 
 
 class Podcast(XmlModel, tag="channel", nsmap=NAMESPACES):
     canonical_link: URL = Field(exclude=True)
     """The declared canonical feed URL for the podcast."""
 
+    links: list[AtomLink] = Field(exclude=True, default_factory=list)
+    """Additional `atom:link` elements besides the canonical link, e.g. to link between pages of a paged feed."""
+
     title: str = element()
     """
     The podcast title. A string containing the name of a podcast and nothing else.
@@ -33,8 +71,13 @@ class Podcast(XmlModel, tag="channel", nsmap=NAMESPACES):
     language: Language = element()
     """The language that is spoken on the podcast, specified in the ISO 639 format."""
 
-    episodes: List[Episode] = element(min_length=1)
-    """Episodes in the podcast."""
+    episodes: EpisodeSequence = element(min_length=1)
+    """
+    Episodes in the podcast. GUIDs and enclosure URLs must be unique across all episodes.
+
+    Besides lists, an `EpisodeCollection`, `CompactEpisodes`, `EpisodeTable` or lazily parsed `LazyEpisodes` are kept
+    as is. They are serialized as lists.
+    """
 
     copyright: str | None = element(default=None)
     """
@@ -45,7 +88,7 @@ class Podcast(XmlModel, tag="channel", nsmap=NAMESPACES):
 
     # Fields from itunes namespace
 
-    categories: List[PodcastCategory] = element(exclude=True, default_factory=list)
+    categories: list[AppleCategory] = element(exclude=True, default_factory=list)
     """
     The category that best fits a podcast, selected from the list of Apple Podcasts categories:
     https://podcasters.apple.com/support/1691-apple-podcasts-categories
@@ -116,6 +159,39 @@ class Podcast(XmlModel, tag="channel", nsmap=NAMESPACES):
     to add a unique text field to prove that they control the feed (and therefore the show).
     """
 
+    @field_validator("episodes")
+    @classmethod
+    def check_unique_episodes(cls, episodes: Sequence[Episode]) -> Sequence[Episode]:
+        return check_unique_episodes(episodes)
+
+    @field_validator("links")
+    @classmethod
+    def share_links(cls, links: list[AtomLink]) -> list[AtomLink]:
+        """Equal links (e.g. to the same hub in many podcasts) share a single instance."""
+        return FLYWEIGHTS.share_all(links)
+
+    @field_validator("episodes", mode="wrap")
+    @classmethod
+    def keep_episode_collection(cls, episodes: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+        """
+        `EpisodeCollection`, `CompactEpisodes` and `EpisodeTable` only hold validated episodes,
+        so they are kept as is instead of copied into a list.
+        """
+        if isinstance(episodes, EpisodeCollection) and episodes:
+            return check_unique_episodes(episodes)
+        if isinstance(episodes, CompactEpisodes) and episodes:
+            check_unique_episodes(episodes.records)
+            return episodes
+        if isinstance(episodes, EpisodeTable):
+            # Columns are validated when the table is created
+            return episodes
+        return handler(episodes)
+
+    @field_serializer("episodes", mode="wrap")
+    def serialize_episodes(self, episodes: Sequence[Episode], handler: SerializerFunctionWrapHandler) -> Any:
+        """Episode sequences that aren't lists (like an `EpisodeCollection`) are serialized like a list."""
+        return handler(episodes if isinstance(episodes, list) else list(episodes))
+
     @computed_element
     def _canonical_link(self) -> AtomLink:
         if isinstance(self.canonical_link, AtomLink):
@@ -123,37 +199,416 @@ class Podcast(XmlModel, tag="channel", nsmap=NAMESPACES):
         else:
             return AtomLink(href=self.canonical_link)
 
+    @computed_element
+    def _links(self) -> list[AtomLink]:
+        return self.links
+
     @computed_element
     def _categories(self) -> list[Category] | None:
-        results: dict[str, Category] = {}
-        for category in self.categories:
-            category_name, sub_category_name = category.category, category.sub_category
-
-            # Add parent category
-            if category_name not in results:
-                results[category.category] = Category(text=category_name)
-
-            parent = results[category.category]
-
-            # Add sub category
-            if sub_category_name and all(
-                sub_category.text != sub_category
-                for sub_category in parent.sub_categories
-            ):
-                parent.sub_categories.append(Category(text=sub_category_name))
-
-        return list(results.values())
-
-    def to_feed(self) -> bytes:
-        return _PodcastFeed(channel=self).to_xml(
-            xml_declaration=True,
-            pretty_print=True,
-            encoding="UTF-8",
-            exclude_none=True,
-            skip_empty=True,
+        return list(_category_tree(tuple(self.categories)))
+
+    @classmethod
+    def validate_partial(cls, data: Mapping[str, Any]) -> "PartialPodcast":
+        """
+        Validate the podcast, but leave out invalid episodes instead of failing.
+
+        Each episode is validated on its own, and every invalid one (including episodes that repeat the GUID or
+        enclosure URL of a previous episode) is reported with its index, GUID and errors
+        in `PartialPodcast.invalid_episodes`. The feed of `PartialPodcast.podcast` can then still be rendered
+        from the valid episodes. Invalid podcast fields (or no valid episode at all) still raise a `ValidationError`.
+        """
+        from podryk.validation import validate_partial
+
+        return validate_partial(data)
+
+    @classmethod
+    def from_feed(cls, source: "FeedSource", lazy: bool = False) -> "Podcast":
+        """
+        Parse an existing RSS feed, e.g. to migrate a podcast from another host.
+
+        `source` is a file path, the feed content as bytes or a binary file object. The feed is parsed incrementally
+        and each `<item>` is discarded from the XML tree after it was mapped onto an `Episode`, so very large feeds
+        can be parsed with little memory besides the resulting models.
+
+        With `lazy`, only the channel fields and the first episode are validated right away. `episodes` is then a
+        `podryk.parsing.LazyEpisodes` sequence, which parses and validates each `<item>` only when it is accessed.
+        """
+        from podryk.parsing import parse_feed
+
+        return parse_feed(source, lazy=lazy)
+
+    def to_feed(
+        self,
+        cache: "FragmentCache | None" = None,
+        compiled: bool = False,
+        minimal_namespaces: bool = False,
+        max_bytes: int | None = None,
+    ) -> bytes:
+        """
+        Serialize the podcast as RSS feed.
+
+        With a `cache`, the serialized `<item>` of each unchanged episode is reused from previous renders.
+        With `compiled`, the XML tree is built by the faster `podryk.compiled` serializer. The output is identical.
+        With `minimal_namespaces`, the `<rss>` element only declares the namespaces that the feed actually uses,
+        instead of all namespaces supported by podryk.
+        With `max_bytes`, the oldest episodes are left out of the feed if it would be larger otherwise.
+        Use `to_trimmed_feed()` to find out which episodes were left out.
+        """
+        if max_bytes is not None:
+            return self.to_trimmed_feed(max_bytes, cache, compiled, minimal_namespaces).feed
+
+        # pydantic only serializes lists, other sequences (like an `EpisodeCollection`) are rendered one at a time
+        if cache is not None or minimal_namespaces or not isinstance(self._feed_episodes(), list):
+            return b"".join(
+                self.iter_feed_chunks(cache=cache, compiled=compiled, minimal_namespaces=minimal_namespaces)
+            )
+
+        return etree.tostring(_to_xml_tree(_PodcastFeed(channel=self._with_episode_list()), compiled), **_XML_OPTIONS)
+
+    def to_trimmed_feed(
+        self,
+        max_bytes: int,
+        cache: "FragmentCache | None" = None,
+        compiled: bool = False,
+        minimal_namespaces: bool = False,
+    ) -> "TrimmedFeed":
+        """
+        Serialize the feed with as many of the newest episodes as fit into `max_bytes`.
+
+        Episodes are serialized one at a time, newest first by publication date, until the next one doesn't fit.
+        Each episode is serialized at most once, and the kept episodes stay in feed order. The feed is identical
+        to the feed of a podcast with only the kept episodes. Raises a `ValueError` if not even the newest episode fits.
+        """
+        episodes = self._feed_episodes()
+        # Items are the same with any declared namespaces that cover them (see `_ItemWriter`)
+        item_writer = _ItemWriter(cache, compiled)
+        # With minimal namespaces, the frame starts out with the namespaces of the channel, and the declarations
+        # of namespaces that only the kept episodes use are added to the size
+        nsmap = self._used_namespaces(episodes=()) if minimal_namespaces else NAMESPACES
+        head, tail = self._feed_frame(compiled, nsmap)
+
+        from podryk.compiled import used_namespaces
+
+        budget = max_bytes - len(head) - len(tail)
+        dates = self._publication_dates(episodes)
+        by_date = sorted(range(len(episodes)), key=lambda index: newest_first(dates[index]))
+        items: dict[int, bytes] = {}
+        for index in by_date:
+            episode = episodes[index]
+            item = item_writer.write(episode)
+            size = len(item) + (len(_ITEM_SEPARATOR) if items else 0)
+
+            added = {}
+            if minimal_namespaces:
+                uris = used_namespaces([episode])
+                added = {prefix: uri for prefix, uri in NAMESPACES.items() if uri in uris and prefix not in nsmap}
+                size += sum(len(f' xmlns:{prefix}="{uri}"') for prefix, uri in added.items())
+
+            if size > budget:
+                break
+            items[index] = item
+            budget -= size
+            if added:
+                nsmap = {prefix: uri for prefix, uri in NAMESPACES.items() if prefix in nsmap or prefix in added}
+                head, tail = self._feed_frame(compiled, nsmap)
+
+        if not items:
+            raise ValueError(f"The feed doesn't fit into {max_bytes} bytes with any episode")
+
+        from podryk.trimming import DroppedEpisode, TrimmedFeed
+
+        return TrimmedFeed(
+            feed=head + _ITEM_SEPARATOR.join(items[index] for index in sorted(items)) + tail,
+            dropped_episodes=[
+                DroppedEpisode(index=index, guid=str(episodes[index].guid.guid))
+                for index in range(len(episodes))
+                if index not in items
+            ],
+        )
+
+    def iter_feed_chunks(
+        self, cache: "FragmentCache | None" = None, compiled: bool = False, minimal_namespaces: bool = False
+    ) -> Iterator[bytes]:
+        """
+        Serialize the feed incrementally, one episode at a time.
+
+        Only the channel without its episodes and a single episode are held as an XML tree at any time.
+        The concatenated chunks are byte-identical to `to_feed()`. The rows of an `EpisodeTable` are rendered
+        by the compiled serializer directly, without creating an `Episode` per row or using the `cache`.
+
+        With `minimal_namespaces`, all episodes are scanned for the namespaces they use before the first chunk
+        is yielded, since the namespaces are declared on the `<rss>` element in front of them.
+        """
+        nsmap = self._used_namespaces() if minimal_namespaces else NAMESPACES
+        head, tail = self._feed_frame(compiled, nsmap)
+        item_writer = _ItemWriter(cache, compiled, nsmap)
+
+        yield head
+        if isinstance(self.episodes, EpisodeTable):
+            for index, row in enumerate(self.episodes.rows()):
+                if index:
+                    yield _ITEM_SEPARATOR
+                yield item_writer.write_row(row)
+        else:
+            for index, episode in enumerate(self._feed_episodes()):
+                if index:
+                    yield _ITEM_SEPARATOR
+                yield item_writer.write(episode)
+        yield tail
+
+    def write_feed(
+        self,
+        file: BinaryIO,
+        cache: "FragmentCache | None" = None,
+        compiled: bool = False,
+        minimal_namespaces: bool = False,
+    ) -> None:
+        """Write the feed to a binary file object without building the whole document in memory."""
+        file.writelines(self.iter_feed_chunks(cache=cache, compiled=compiled, minimal_namespaces=minimal_namespaces))
+
+    def to_compressed_feed(
+        self,
+        encoding: str = "gzip",
+        cache: "FragmentCache | None" = None,
+        compiled: bool = False,
+        minimal_namespaces: bool = False,
+    ) -> "CompressedFeed":
+        """
+        Serialize the feed and compress it while it is being rendered.
+
+        Besides the compressed content, the result has a strong ETag over the feed content and a Last-Modified date
+        from the newest episode for conditional HTTP requests. Supported encodings are `gzip` and `identity`,
+        as well as `br` and `zstd` if the corresponding library is installed.
+        """
+        from podryk.compression import compress_feed
+
+        chunks = self.iter_feed_chunks(cache=cache, compiled=compiled, minimal_namespaces=minimal_namespaces)
+        return compress_feed(chunks, encoding, last_modified=self.last_modified)
+
+    def iter_pages(
+        self,
+        page_size: int,
+        archive_url: str,
+        published_archives: int = 0,
+        cache: "FragmentCache | None" = None,
+        compiled: bool = False,
+        minimal_namespaces: bool = False,
+    ) -> Iterator["FeedPage"]:
+        """
+        Split the episodes into a current page and archive pages (RFC 5005) and render each page once.
+
+        See `podryk.paging.iter_pages` for details.
+        """
+        from podryk.paging import iter_pages
+
+        return iter_pages(
+            self,
+            page_size,
+            archive_url,
+            published_archives,
+            cache=cache,
+            compiled=compiled,
+            minimal_namespaces=minimal_namespaces,
         )
 
+    def externalize_chapters(self, directory: str | os.PathLike, chapters_url: str) -> "ExternalChapters":
+        """
+        Write the chapters of the episodes to JSON chapter files, and link to the files instead of listing them.
+
+        See `podryk.chapters.externalize_chapters` for details.
+        """
+        from podryk.chapters import externalize_chapters
+
+        return externalize_chapters(self, directory, chapters_url)
+
+    def fingerprint(self, minimal_namespaces: bool = False) -> str:
+        """
+        Hash over all field values of the podcast and its episodes, and the render options that change the feed.
+
+        It is much cheaper to compute than the feed itself, and the same fingerprint always results in the same feed
+        when rendered with the same `minimal_namespaces` option (the cache and the compiled serializer don't change
+        the output).
+        """
+        from podryk.cache import fragment_key
+
+        key = fragment_key(self._with_episode_list())
+        if minimal_namespaces:
+            key = hashlib.sha256(f"{key}\0minimal_namespaces".encode()).hexdigest()
+        return key
+
+    def render_if_changed(
+        self,
+        previous_fingerprint: str | None,
+        cache: "FragmentCache | None" = None,
+        compiled: bool = False,
+        minimal_namespaces: bool = False,
+    ) -> tuple[str, bytes | None]:
+        """
+        Render the feed only if the podcast changed since the render that produced `previous_fingerprint`.
+
+        Returns the current fingerprint and the feed, or `None` instead of the feed if nothing changed.
+        """
+        fingerprint = self.fingerprint(minimal_namespaces=minimal_namespaces)
+        if fingerprint == previous_fingerprint:
+            return fingerprint, None
+        return fingerprint, self.to_feed(cache=cache, compiled=compiled, minimal_namespaces=minimal_namespaces)
+
+    @property
+    def last_modified(self) -> datetime | None:
+        """The publication date of the newest episode."""
+        return max((date for date in self._publication_dates(self.episodes) if date is not None), default=None)
+
+    @staticmethod
+    def _publication_dates(episodes: Sequence[Episode]) -> list[datetime | None]:
+        if isinstance(episodes, EpisodeTable):
+            return episodes.column("publication_date") or [None] * len(episodes)
+        return [episode.publication_date for episode in episodes]
+
+    def _feed_episodes(self) -> Sequence[Episode]:
+        """The episodes in feed order."""
+        if isinstance(self.episodes, EpisodeCollection) and self.type == PodcastType.SERIAL:
+            return self.episodes.in_number_order()
+        return self.episodes
+
+    def _with_episode_list(self) -> "Podcast":
+        """pydantic-xml only renders lists, while episodes may be e.g. lazily loaded from a feed."""
+        episodes = self._feed_episodes()
+        if isinstance(episodes, list) and episodes is self.episodes:
+            return self
+        return self.model_copy(update={"episodes": episodes if isinstance(episodes, list) else list(episodes)})
+
+    def _used_namespaces(self, episodes: Iterable[Any] | None = None) -> dict[str, str]:
+        """The namespaces (of `NAMESPACES`) that the elements and attributes of the feed (with `episodes`) are in."""
+        channel = self.model_copy(update={"episodes": []})
+        if episodes is None:
+            episodes = self.episodes.rows() if isinstance(self.episodes, EpisodeTable) else self._feed_episodes()
+        from podryk.compiled import used_namespaces
+
+        uris = used_namespaces(itertools.chain([_PodcastFeed(channel=channel)], episodes))
+        return {prefix: uri for prefix, uri in NAMESPACES.items() if uri in uris}
+
+    def _feed_frame(self, compiled: bool = False, nsmap: dict[str, str] = NAMESPACES) -> tuple[bytes, bytes]:
+        """Render the feed around the episodes, split at the position where the first episode would start."""
+        channel = self.model_copy(update={"episodes": self.episodes[:1]})
+        tree = _to_xml_tree(_PodcastFeed(channel=channel), compiled)
+
+        channel_element = tree.find("channel")
+        channel_element.replace(channel_element.find("item"), etree.Comment(_ITEMS_MARKER))
+
+        if nsmap is not NAMESPACES:
+            tree = _redeclare_namespaces(tree, nsmap)
+
+        head, tail = etree.tostring(tree, **_XML_OPTIONS).split(_ITEMS_MARKER_BYTES)
+        return head, tail
+
+
+@lru_cache(maxsize=1024)
+def _category_tree(categories: tuple[PodcastCategory, ...]) -> tuple[Category, ...]:
+    """
+    The `<itunes:category>` elements for a combination of categories, with sub-categories grouped by parent.
+
+    Many podcasts share the same categories, so the (frozen) trees are built once and shared.
+    """
+    sub_categories: dict[str, list[str]] = {}
+    for category in categories:
+        names = sub_categories.setdefault(category.category, [])
+        if category.sub_category is not None and category.sub_category not in names:
+            names.append(category.sub_category)
+
+    return tuple(
+        Category(text=name, sub_categories=tuple(Category(text=sub_category) for sub_category in names))
+        for name, names in sub_categories.items()
+    )
+
+
+_TREE_OPTIONS = {"exclude_none": True, "skip_empty": True}
+_XML_OPTIONS = {"xml_declaration": True, "pretty_print": True, "encoding": "UTF-8"}
+
+_ITEMS_MARKER = "podryk:items"
+_ITEMS_MARKER_BYTES = f"<!--{_ITEMS_MARKER}-->".encode()
+_ITEM_SEPARATOR = b"\n    "
+"""Whitespace between two consecutive items, matching the pretty printed indentation inside `<channel>`."""
+
+
+def _to_xml_tree(model: BaseXmlModel, compiled: bool) -> etree._Element:
+    if not compiled:
+        return model.to_xml_tree(**_TREE_OPTIONS)
+
+    from podryk.compiled import to_xml_tree
+
+    return to_xml_tree(model)
+
+
+def _redeclare_namespaces(root: etree._Element, nsmap: dict[str, str]) -> etree._Element:
+    """Move the content of `root` to a copy of it that only declares the namespaces in `nsmap`."""
+    # lxml can't change the declarations of an existing element
+    new_root = etree.Element(root.tag, attrib=dict(root.attrib), nsmap=nsmap)
+    new_root.extend(root)
+    # The declarations for the episodes, which aren't part of the tree yet, are kept
+    etree.cleanup_namespaces(new_root, keep_ns_prefixes=list(nsmap))
+    return new_root
+
+
+class _ItemWriter:
+    """
+    Serializes episodes exactly as they appear nested in a feed.
+
+    The episode is placed in an otherwise empty `<rss><channel>` frame so that namespace declarations
+    and indentation match the full document, and is cut out of the frame again afterward.
+    """
+
+    def __init__(
+        self, cache: "FragmentCache | None" = None, compiled: bool = False, nsmap: dict[str, str] = NAMESPACES
+    ):
+        self._cache = cache
+        self._compiled = compiled
+        self._minimal_namespaces = nsmap is not NAMESPACES
+        self._root = etree.Element("rss", nsmap=nsmap)
+        self._channel = etree.SubElement(self._root, "channel")
+
+        marker = etree.Comment(_ITEMS_MARKER)
+        self._channel.append(marker)
+        frame = etree.tostring(self._root, **_XML_OPTIONS)
+        self._channel.remove(marker)
+
+        self._prefix_length = frame.index(_ITEMS_MARKER_BYTES)
+        self._suffix_length = len(frame) - self._prefix_length - len(_ITEMS_MARKER_BYTES)
+
+    def write(self, episode: Episode) -> bytes:
+        if self._cache is None:
+            return self._render(episode)
+
+        from podryk.cache import fragment_key
+
+        key = fragment_key(episode)
+        fragment = self._cache.get(key)
+        if fragment is None:
+            fragment = self._render(episode)
+            self._cache.set(key, fragment)
+        return fragment
+
+    def write_row(self, row: Any) -> bytes:
+        """Serialize a row of an `EpisodeTable`, which is only supported by the compiled serializer."""
+        from podryk.compiled import to_xml_tree
+
+        return self._render_tree(to_xml_tree(row))
+
+    def _render(self, episode: Episode) -> bytes:
+        return self._render_tree(_to_xml_tree(episode, self._compiled))
+
+    def _render_tree(self, item: etree._Element) -> bytes:
+        self._channel.append(item)
+        try:
+            if self._minimal_namespaces:
+                # Appending only removes the declarations the frame has as well, not the unused ones
+                etree.cleanup_namespaces(item)
+            xml = etree.tostring(self._root, **_XML_OPTIONS)
+        finally:
+            self._channel.remove(item)
+
+        return xml[self._prefix_length : len(xml) - self._suffix_length]
+
 
-class _PodcastFeed(BaseXmlModel, tag="rss", nsmap=NAMESPACES):
+class _PodcastFeed(XmlModel, tag="rss", nsmap=NAMESPACES):
     version: str = attr(default="2.0")
     channel: Podcast = element()
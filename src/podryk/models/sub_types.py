@@ -1,18 +1,15 @@
 from __future__ import annotations
 
 import uuid
+from typing import Literal
 
-from pydantic import (
-    HttpUrl,
-    TypeAdapter,
-    ValidationError,
-    model_validator,
-)
+from pydantic import ConfigDict, model_validator
 from pydantic_xml import attr, element
 
 from podryk.models.enum import AtomLinkRel
-from podryk.models.field_types import URL, Duration, MediaType
+from podryk.models.field_types import URL, Duration, InternedString, MediaType
 from podryk.models.namespaces import NAMESPACES, Namespace
+from podryk.models.validators import is_http_url, media_type_from_url
 from podryk.models.xml_model import XmlModel
 
 
@@ -29,15 +26,20 @@ class Guid(XmlModel, tag="guid"):
         is_permalink = data.get("is_permalink")
 
         if is_permalink is None:
-            try:
-                TypeAdapter(HttpUrl).validate_python(guid)
-                data["is_permalink"] = None
-            except ValidationError:
-                data["is_permalink"] = False
+            data["is_permalink"] = None if is_http_url(guid) else False
 
         return data
 
 
+def _infer_media_type(data: dict) -> dict:
+    """Infer a missing `type` from the file extension of `url`."""
+    if isinstance(data, dict) and data.get("type") is None and isinstance(data.get("url"), str):
+        media_type = media_type_from_url(data["url"])
+        if media_type is not None:
+            data = {**data, "type": media_type}
+    return data
+
+
 class Enclosure(XmlModel, tag="enclosure"):
     """The audio/video episode content, file size, and file type information."""
 
@@ -48,13 +50,27 @@ class Enclosure(XmlModel, tag="enclosure"):
     """The length of the file in bytes."""
 
     type: MediaType = attr()
-    """MIME type of the media file."""
+    """MIME type of the media file. Inferred from the file extension of `url` if omitted."""
+
+    @model_validator(mode="before")
+    @classmethod
+    def set_type_default(cls, data: dict) -> dict:
+        return _infer_media_type(data)
 
 
 class Transcript(XmlModel, tag="transcript", ns=Namespace.PODCAST):
+    # Equal transcripts share a single instance (see `Episode.share_transcripts`)
+    model_config = ConfigDict(frozen=True)
+
     url: URL = attr()
     type: MediaType = attr()
-    language: str | None = attr(default=None)
+    """Inferred from the file extension of `url` if omitted."""
+    language: InternedString[str | None] = attr(default=None)
+
+    @model_validator(mode="before")
+    @classmethod
+    def set_type_default(cls, data: dict) -> dict:
+        return _infer_media_type(data)
 
 
 class Chapter(XmlModel, tag="chapter", ns=Namespace.CHAPTERS):
@@ -74,7 +90,18 @@ class Chapters(XmlModel, tag="chapters", ns=Namespace.CHAPTERS):
     chapters: list[Chapter] = element()
 
 
+class ChaptersLink(XmlModel, tag="chapters", ns=Namespace.PODCAST):
+    """Link to the chapters of an episode in an external file, e.g. written by `podryk.chapters`."""
+
+    url: URL = attr()
+    type: Literal["application/json+chapters"] = attr(default="application/json+chapters")
+    """The media type of JSON chapter files, the only chapter format supported by podryk."""
+
+
 class AtomLink(XmlModel, tag="link", ns=Namespace.ATOM):
+    # Equal links share a single instance (see `Podcast.share_links`)
+    model_config = ConfigDict(frozen=True)
+
     href: URL = attr()
     rel: AtomLinkRel = attr(default=AtomLinkRel.SELF)
     type: MediaType = attr(default="application/rss+xml")
@@ -95,5 +122,8 @@ class TextRecord(XmlModel, tag="txt", ns=Namespace.PODCAST):
 
 
 class Category(XmlModel, tag="category", ns=Namespace.ITUNES, nsmap=NAMESPACES):
+    # Category trees are shared between podcasts (see `Podcast._categories`)
+    model_config = ConfigDict(frozen=True)
+
     text: str = attr()
-    sub_categories: list[Category] = element(default_factory=list)
+    sub_categories: tuple[Category, ...] = element(default=())
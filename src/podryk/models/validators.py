@@ -0,0 +1,110 @@
+"""
+Validation helpers shared by all models.
+
+Adapters and lookup tables are built once at import. Feeds repeat the same few media types and many similar URLs
+thousands of times, so lookups are O(1) and URL checks are memoized.
+"""
+
+import posixpath
+from collections import OrderedDict
+from collections.abc import Hashable
+from functools import lru_cache
+from threading import Lock
+from typing import TypeVar
+from urllib.parse import urlsplit
+
+import content_types
+from pydantic import BaseModel, HttpUrl, TypeAdapter, ValidationError
+
+MEDIA_TYPES = frozenset(content_types.EXTENSION_TO_CONTENT_TYPE.values())
+"""All known media types."""
+
+EXTENSION_TO_MEDIA_TYPE = {
+    extension.lower(): media_type for extension, media_type in content_types.EXTENSION_TO_CONTENT_TYPE.items()
+}
+"""Media types by lower case file extension (without the dot)."""
+
+_HTTP_URL = TypeAdapter(HttpUrl)
+
+Model = TypeVar("Model", bound=BaseModel)
+
+
+def is_media_type(value: str) -> bool:
+    return value in MEDIA_TYPES
+
+
+def media_type_from_url(url: str) -> str | None:
+    """Infer the media type from the file extension of the URL path, e.g. `audio/mpeg` for `.../episode.mp3`."""
+    extension = posixpath.splitext(urlsplit(url).path)[1]
+    return EXTENSION_TO_MEDIA_TYPE.get(extension[1:].lower()) if extension else None
+
+
+def is_http_url(value: object) -> bool:
+    """Whether `value` is a valid HTTP(S) URL. Results for strings are memoized."""
+    if isinstance(value, str):
+        return _is_http_url_string(value)
+    return _validate_http_url(value)
+
+
+@lru_cache(maxsize=8192)
+def _is_http_url_string(value: str) -> bool:
+    return _validate_http_url(value)
+
+
+def _validate_http_url(value: object) -> bool:
+    try:
+        _HTTP_URL.validate_python(value)
+        return True
+    except ValidationError:
+        return False
+
+
+@lru_cache(maxsize=4096)
+def _shared(value: str) -> str:
+    return value
+
+
+def intern_string(value: str | None) -> str | None:
+    """
+    Return the first seen string equal to `value`, so that values repeated across episodes share one object.
+
+    Unlike `sys.intern`, the table is bounded and strings are released once they fall out of it.
+    """
+    return _shared(value) if isinstance(value, str) else value
+
+
+class Flyweights:
+    """Bounded LRU of model instances by their field values, so that equal instances can share a single object."""
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self._instances: OrderedDict[Hashable, BaseModel] = OrderedDict()
+        self._lock = Lock()
+
+    def share(self, instance: Model) -> Model:
+        """Return the first seen instance equal to `instance`. Only instances of frozen models are shared."""
+        if not instance.model_config.get("frozen"):
+            return instance
+
+        key = (type(instance), *instance.__dict__.values())
+        try:
+            hash(key)
+        except TypeError:
+            return instance
+
+        with self._lock:
+            shared = self._instances.get(key)
+            if shared is None:
+                self._instances[key] = shared = instance
+                if len(self._instances) > self.max_size:
+                    self._instances.popitem(last=False)
+            else:
+                self._instances.move_to_end(key)
+            return shared
+
+    def share_all(self, instances: list[Model] | None) -> list[Model] | None:
+        return None if instances is None else [self.share(instance) for instance in instances]
+
+
+FLYWEIGHTS = Flyweights()
+"""Shared instances of small frozen models that repeat across episodes and pages, like `Transcript` and `AtomLink`."""
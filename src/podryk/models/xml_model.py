@@ -1,11 +1,68 @@
 from abc import ABC
+from threading import RLock
+from typing import Any, Self
 
+from lxml import etree
 from pydantic import ConfigDict
 from pydantic_xml import BaseXmlModel
 
+from podryk.models.annotations import find_model
+
+_BUILT: set[type] = set()
+"""Models whose validator and serializer, and those of all nested models, are built."""
+
+_BUILD_LOCK = RLock()
+
 
 class XmlModel(BaseXmlModel, ABC):
     model_config = ConfigDict(
         use_attribute_docstrings=True,
         extra="forbid",
+        # Validators and XML serializers are built on first use (or by `podryk.warmup()`) to keep imports fast
+        defer_build=True,
     )
+
+    @classmethod
+    def build(cls) -> None:
+        """Build the validator and the XML serializer (and those of all nested models) now instead of on first use."""
+        with _BUILD_LOCK:
+            # Models are only marked as built once all of them are, so other threads wait for the lock until then
+            built = set()
+            pending = [cls]
+            while pending:
+                model = pending.pop()
+                if model in _BUILT or model in built:
+                    continue
+                built.add(model)
+
+                if not model.__pydantic_complete__:
+                    model.model_rebuild()
+                if model.__xml_serializer__ is None:
+                    model.__build_serializer__()
+
+                # Sub-models (e.g. the `Chapters` of the computed `Episode._chapters`) are serialized by the parent's
+                # serializer, which expects their serializers to exist
+                annotations = [
+                    *(field.annotation for field in model.model_fields.values()),
+                    *(field.return_type for field in model.model_computed_fields.values()),
+                ]
+                pending.extend(
+                    sub_model
+                    for sub_model in map(find_model, annotations)
+                    if sub_model is not None and issubclass(sub_model, XmlModel)
+                )
+
+            _BUILT.update(built)
+
+    def to_xml_tree(self, **kwargs: Any) -> etree._Element:
+        # Instances created by a parent model or without validation don't build the serializers
+        if type(self) not in _BUILT:
+            type(self).build()
+        return super().to_xml_tree(**kwargs)
+
+    @classmethod
+    def from_xml_tree(cls, root: etree._Element, **kwargs: Any) -> Self:
+        # Also used by `from_xml()`, which pydantic-xml only allows once the serializers are built
+        if cls not in _BUILT:
+            cls.build()
+        return super().from_xml_tree(root, **kwargs)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from podryk.cache import FragmentCache
+from podryk.collection import newest_first
+from podryk.models.enum import AtomLinkRel
+from podryk.models.sub_types import AtomLink
+
+if TYPE_CHECKING:
+    from podryk.models.episode import Episode
+    from podryk.models.podcast import Podcast
+
+
+@dataclass(frozen=True, slots=True)
+class FeedPage:
+    """A single rendered page of a paged feed."""
+
+    number: int | None
+    """Number of the archive page, starting at 1 for the oldest episodes. `None` for the current page."""
+
+    url: str
+    """The URL the page is published at."""
+
+    feed: bytes
+
+    @property
+    def archive(self) -> bool:
+        """Archive pages never change once published and can be cached indefinitely."""
+        return self.number is not None
+
+
+def iter_pages(
+    podcast: Podcast,
+    page_size: int,
+    archive_url: str,
+    published_archives: int = 0,
+    cache: FragmentCache | None = None,
+    compiled: bool = False,
+    minimal_namespaces: bool = False,
+) -> Iterator[FeedPage]:
+    """
+    Split the episodes of a podcast into a current page and archive pages, and render every page once.
+
+    Episodes are sorted by publication date, newest first. Archive pages are filled with the oldest episodes,
+    and always hold exactly `page_size` episodes. The current page at `canonical_link` holds the remaining
+    1 to `page_size` newest episodes. `archive_url` is formatted with the archive page number,
+    e.g. `https://example.com/feed-{page}.rss`.
+
+    Pages link to the next older page with `prev-archive` (RFC 5005 archived feeds) and `next` (RFC 5005 paged feeds).
+    Archive pages link back to the current page with `current`. Archive pages don't link to newer pages,
+    so their content never changes once they are full. Archives up to `published_archives` are therefore skipped.
+    """
+    if page_size < 1:
+        raise ValueError(f"Page size must be positive: {page_size}")
+
+    episodes = sorted(podcast.episodes, key=lambda episode: newest_first(episode.publication_date))
+    archive_count = (len(episodes) - 1) // page_size
+    current_size = len(episodes) - archive_count * page_size
+
+    def page_url(number: int) -> str:
+        return archive_url.format(page=number)
+
+    def render(number: int | None, url: str, page_episodes: list[Episode], links: list[AtomLink]) -> FeedPage:
+        page = podcast.model_copy(
+            update={"canonical_link": url, "links": [*podcast.links, *links], "episodes": page_episodes}
+        )
+        feed = page.to_feed(cache=cache, compiled=compiled, minimal_namespaces=minimal_namespaces)
+        return FeedPage(number=number, url=url, feed=feed)
+
+    yield render(None, podcast.canonical_link, episodes[:current_size], _older_links(page_url, archive_count))
+
+    # Episodes are newest first, so the newest archive page starts right after the current page
+    for number in range(archive_count, published_archives, -1):
+        start = current_size + (archive_count - number) * page_size
+        links = [AtomLink(href=podcast.canonical_link, rel=AtomLinkRel.CURRENT), *_older_links(page_url, number - 1)]
+        yield render(number, page_url(number), episodes[start : start + page_size], links)
+
+
+def _older_links(page_url: Callable[[int], str], number: int) -> list[AtomLink]:
+    if number < 1:
+        return []
+    return [
+        AtomLink(href=page_url(number), rel=AtomLinkRel.PREV_ARCHIVE),
+        AtomLink(href=page_url(number), rel=AtomLinkRel.NEXT),
+    ]
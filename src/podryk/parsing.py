@@ -0,0 +1,426 @@
+"""
+Parse existing RSS podcast feeds into `Podcast` and `Episode` models.
+
+The feed is read incrementally: every `<item>` is mapped to an `Episode` as soon as it is complete and then removed
+from the XML tree, so memory usage doesn't grow with the size of the XML document.
+
+Alternatively, episodes can be loaded lazily: a single scan over the raw feed records the byte range of every `<item>`,
+and each item is only parsed and validated once it is accessed.
+"""
+
+from __future__ import annotations
+
+import io
+import mmap
+import os
+import re
+import weakref
+from collections.abc import Iterator, Sequence
+from datetime import UTC, datetime, timedelta
+from email.utils import parsedate_to_datetime
+from typing import IO, TYPE_CHECKING, Any, Self, overload
+
+from lxml import etree
+
+from podryk.models.enum import AtomLinkRel, PodcastCategory
+from podryk.models.namespaces import NAMESPACES, Namespace
+
+if TYPE_CHECKING:
+    from podryk.models.episode import Episode
+    from podryk.models.podcast import Podcast
+
+FeedSource = str | os.PathLike | bytes | IO[bytes]
+"""A file path, the feed content, or a binary file object."""
+
+
+def _tag(namespace: str, name: str) -> str:
+    return f"{{{NAMESPACES[namespace]}}}{name}"
+
+
+_ITUNES_CATEGORY = _tag(Namespace.ITUNES, "category")
+_ATOM_LINK = _tag(Namespace.ATOM, "link")
+_CHAPTERS = _tag(Namespace.CHAPTERS, "chapters")
+_TRANSCRIPT = _tag(Namespace.PODCAST, "transcript")
+_CHAPTERS_LINK = _tag(Namespace.PODCAST, "chapters")
+_TEXT_RECORD = _tag(Namespace.PODCAST, "txt")
+
+_TRUE_VALUES = {"true", "yes", "explicit"}
+_LINK_RELATIONS = set(AtomLinkRel)
+
+
+def parse_feed(source: FeedSource, lazy: bool = False) -> Podcast:
+    """Parse a podcast feed. See `Podcast.from_feed`."""
+    from podryk.models.podcast import Podcast
+
+    if lazy:
+        return _parse_feed_lazily(source)
+
+    episodes = []
+    channel = None
+    for element in iter_items(source):
+        if element.tag == "item":
+            episodes.append(episode_from_element(element))
+        else:
+            channel = element
+
+    if channel is None:
+        raise ValueError("Feed has no <channel> element")
+
+    return Podcast.model_validate({**podcast_data(channel), "episodes": episodes})
+
+
+def iter_items(source: FeedSource) -> Iterator[etree._Element]:
+    """
+    Yield each `<item>` element of the feed, followed by the `<channel>` element (without items) at the end.
+
+    Elements are only valid until the next element is requested, since they are cleared afterward.
+    """
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+
+    parser = etree.iterparse(
+        source,
+        events=("end",),
+        tag=("item", "channel"),
+        resolve_entities=False,
+        no_network=True,
+        huge_tree=True,
+        strip_cdata=True,
+    )
+    for _, element in parser:
+        yield element
+
+        if element.tag == "item":
+            # Drop the processed item from the tree to keep memory flat
+            element.clear(keep_tail=False)
+            element.getparent().remove(element)
+
+
+class LazyEpisodes(Sequence["Episode"]):
+    """
+    Episodes of a parsed feed that are only parsed and validated when they are accessed.
+
+    Accessed episodes are kept, so each `<item>` is parsed at most once.
+
+    Feeds parsed from a file path are memory-mapped until `close()` is called (or the sequence is used as context
+    manager), at the latest when the sequence is garbage collected.
+    """
+
+    def __init__(self, content: bytes | mmap.mmap, prolog: bytes, offsets: list[tuple[int, int]]):
+        self._content = content
+        self._prolog = prolog
+        """
+        Everything up to the root start tag and the `<channel>` start tag, so that item fragments can be parsed
+        with the namespaces declared on either in scope.
+        """
+        self._offsets = offsets
+        self._episodes: list[Episode | None] = [None] * len(offsets)
+        self._finalizer = weakref.finalize(self, content.close) if isinstance(content, mmap.mmap) else None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    @overload
+    def __getitem__(self, index: int) -> Episode: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Episode]: ...
+
+    def __getitem__(self, index: int | slice) -> Episode | list[Episode]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+
+        episode = self._episodes[index]
+        if episode is None:
+            if self.closed:
+                raise ValueError("Can't load episodes of a closed feed")
+            start, end = self._offsets[index]
+            document = etree.fromstring(self._prolog + self._content[start:end] + _FRAGMENT_END, _FRAGMENT_PARSER)
+            episode = self._episodes[index] = episode_from_element(document.find("channel/item"))
+        return episode
+
+    @property
+    def loaded(self) -> int:
+        """The number of episodes that were parsed so far."""
+        return sum(episode is not None for episode in self._episodes)
+
+    def load(self) -> list[Episode]:
+        """Parse and validate all remaining episodes."""
+        return self[:]
+
+    def close(self) -> None:
+        """Unmap the feed file. Episodes that weren't accessed before can't be loaded afterward."""
+        if self._finalizer is not None:
+            self._finalizer()
+
+    @property
+    def closed(self) -> bool:
+        return self._finalizer is not None and not self._finalizer.alive
+
+
+_TOKENS = re.compile(
+    rb"<!\[CDATA\[.*?\]\]>|<!--.*?-->|<\?.*?\?>|<!DOCTYPE(?:[^>\[]|\[.*?\])*>"
+    rb"|<(?P<end>/)?(?P<tag>rss|channel|item)(?=[\s/>])(?:[^>\"']|\"[^\"]*\"|'[^']*')*?(?P<empty>/)?>",
+    re.DOTALL,
+)
+"""
+Markup that may contain `<item` without being an item (CDATA, comments, ...), and the `<rss>`, `<channel>`
+and `<item>` tags.
+"""
+
+_FRAGMENT_END = b"</channel></rss>"
+_FRAGMENT_PARSER = etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=True, strip_cdata=True)
+
+
+def _scan(content: bytes | mmap.mmap) -> tuple[bytes, list[tuple[int, int]]]:
+    """
+    Find the prolog up to the root start tag followed by the `<channel>` start tag, and the byte range of every
+    `<item>` element in the channel.
+    """
+    prolog = None
+    channel = None
+    offsets = []
+    start = None
+
+    for match in _TOKENS.finditer(content):
+        tag = match.group("tag")
+        if tag == b"rss" and prolog is None and not match.group("end"):
+            prolog = bytes(content[: match.end()])
+        elif tag == b"channel" and channel is None and not match.group("end") and not match.group("empty"):
+            channel = bytes(match.group())
+        elif tag == b"item" and match.group("end"):
+            if start is not None:
+                offsets.append((start, match.end()))
+                start = None
+        elif tag == b"item" and match.group("empty"):
+            offsets.append((match.start(), match.end()))
+        elif tag == b"item":
+            start = match.start()
+
+    if prolog is None:
+        raise ValueError("Feed has no <rss> element")
+    if channel is None:
+        raise ValueError("Feed has no <channel> element")
+    return prolog + channel, offsets
+
+
+def _parse_feed_lazily(source: FeedSource) -> Podcast:
+    from podryk.models.podcast import Podcast
+
+    content = _read(source)
+    prolog, offsets = _scan(content)
+    episodes = LazyEpisodes(content, prolog, offsets)
+
+    # The channel is parsed from the feed with all items cut out
+    parts, position = [], 0
+    for start, end in offsets:
+        parts.append(content[position:start])
+        position = end
+    parts.append(content[position:])
+    channel = etree.fromstring(b"".join(parts), _FRAGMENT_PARSER).find("channel")
+    if channel is None:
+        raise ValueError("Feed has no <channel> element")
+
+    # Validate the channel fields with the first episode, then swap in all episodes without validating them
+    podcast = Podcast.model_validate({**podcast_data(channel), "episodes": episodes[:1]})
+    return podcast.model_copy(update={"episodes": episodes})
+
+
+def _read(source: FeedSource) -> bytes | mmap.mmap:
+    if isinstance(source, bytes):
+        return source
+    elif isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            # Memory-mapped, so only the parts of the file that are accessed are read
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    else:
+        return source.read()
+
+
+def episode_from_element(item: etree._Element) -> Episode:
+    from podryk.models.episode import Episode
+
+    return Episode.model_validate(episode_data(item))
+
+
+def episode_data(item: etree._Element) -> dict[str, Any]:
+    """Map an `<item>` element onto the fields of `Episode`."""
+    enclosure = item.find("enclosure")
+    guid = item.find("guid")
+    chapters = item.find(_CHAPTERS)
+    chapters_link = item.find(_CHAPTERS_LINK)
+
+    data = {
+        "title": _text(item, "title"),
+        "enclosure": _attributes(enclosure, "url", "length", "type") if enclosure is not None else None,
+        "guid": _guid(guid) if guid is not None else _guid_from_enclosure(enclosure),
+        "link": _text(item, "link"),
+        "publication_date": _date(_text(item, "pubDate")),
+        "description": _text(item, "description", strip=False),
+        "duration": _duration(_text(item, _tag(Namespace.ITUNES, "duration"))),
+        "image": _attribute(item, _tag(Namespace.ITUNES, "image"), "href"),
+        "explicit": _bool(_text(item, _tag(Namespace.ITUNES, "explicit"))),
+        "season_number": _text(item, _tag(Namespace.ITUNES, "season")),
+        "episode_number": _text(item, _tag(Namespace.ITUNES, "episode")),
+        "type": _text(item, _tag(Namespace.ITUNES, "episodeType")),
+        "block": _bool(_text(item, _tag(Namespace.ITUNES, "block"))),
+        "transcripts": [
+            _attributes(transcript, "url", "type", "language") for transcript in item.iterchildren(_TRANSCRIPT)
+        ]
+        or None,
+        "chapters_link": _attributes(chapters_link, "url", "type") if chapters_link is not None else None,
+        "chapters": _chapters(chapters) if chapters is not None else None,
+    }
+    return _without_none(data)
+
+
+def podcast_data(channel: etree._Element) -> dict[str, Any]:
+    """Map a `<channel>` element (without `<item>` children) onto the fields of `Podcast`."""
+    canonical_link = None
+    links = []
+    for link in channel.iterchildren(_ATOM_LINK):
+        rel = link.get("rel", AtomLinkRel.ALTERNATE)
+        if rel == AtomLinkRel.SELF and canonical_link is None:
+            canonical_link = link.get("href")
+        elif rel in _LINK_RELATIONS:
+            # Relations unknown to `AtomLinkRel` (e.g. WebSub hubs) are skipped
+            links.append(_attributes(link, "href", "rel", "type"))
+
+    data = {
+        "canonical_link": canonical_link or _text(channel, "link"),
+        "links": links,
+        "title": _text(channel, "title"),
+        "description": _text(channel, "description", strip=False),
+        "link": _text(channel, "link"),
+        "language": _text(channel, "language"),
+        "copyright": _text(channel, "copyright"),
+        "categories": _categories(channel),
+        "explicit": _bool(_text(channel, _tag(Namespace.ITUNES, "explicit"))),
+        "image": _attribute(channel, _tag(Namespace.ITUNES, "image"), "href"),
+        "author": _text(channel, _tag(Namespace.ITUNES, "author")),
+        "type": _text(channel, _tag(Namespace.ITUNES, "type")),
+        "complete": _bool(_text(channel, _tag(Namespace.ITUNES, "complete"))),
+        "locked": _bool(_text(channel, _tag(Namespace.PODCAST, "locked"))),
+        "guid": _text(channel, _tag(Namespace.PODCAST, "guid")),
+        "text_records": [
+            _without_none({"purpose": record.get("purpose"), "content": record.text or ""})
+            for record in channel.iterchildren(_TEXT_RECORD)
+        ]
+        or None,
+    }
+    return _without_none(data)
+
+
+def _text(element: etree._Element, tag: str, strip: bool = True) -> str | None:
+    child = element.find(tag)
+    if child is None or child.text is None:
+        return None
+    return (child.text.strip() if strip else child.text) or None
+
+
+def _attributes(element: etree._Element, *names: str) -> dict[str, str]:
+    return {name: element.get(name) for name in names if element.get(name) is not None}
+
+
+def _attribute(element: etree._Element, tag: str, name: str) -> str | None:
+    child = element.find(tag)
+    return None if child is None else child.get(name)
+
+
+def _without_none(data: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in data.items() if value is not None}
+
+
+def _bool(value: str | None) -> bool | None:
+    return None if value is None else value.lower() in _TRUE_VALUES
+
+
+def _date(value: str | None) -> datetime | str | None:
+    """Parse RFC 2822 dates. Invalid dates are returned as is, so that validation reports them for the item."""
+    if value is None:
+        return None
+
+    try:
+        date = parsedate_to_datetime(value)
+    except ValueError:
+        return value
+    # `-0000` (no time zone information) results in a naive datetime, which is UTC
+    return date if date.tzinfo is not None else date.replace(tzinfo=UTC)
+
+
+def _duration(value: str | None) -> timedelta | str | None:
+    """
+    Parse durations given as seconds (`2700`) or as clock time (`45:00`, `1:02:03.5`).
+
+    Invalid durations are returned as is, so that validation reports them for the item.
+    """
+    if value is None:
+        return None
+
+    seconds = 0.0
+    try:
+        for part in value.split(":"):
+            seconds = seconds * 60 + float(part)
+        return timedelta(seconds=seconds)
+    except (ValueError, OverflowError):
+        return value
+
+
+def _guid(guid: etree._Element) -> dict[str, Any]:
+    is_permalink = guid.get("isPermaLink")
+    data = {"guid": (guid.text or "").strip()}
+    if is_permalink is not None:
+        data["is_permalink"] = is_permalink.lower() == "true"
+    return data
+
+
+def _guid_from_enclosure(enclosure: etree._Element | None) -> dict[str, Any] | None:
+    """Feeds without GUIDs are identified by their enclosure URL, which is what most podcast apps do as well."""
+    if enclosure is None or enclosure.get("url") is None:
+        return None
+    return {"guid": enclosure.get("url"), "is_permalink": False}
+
+
+def _chapters(chapters: etree._Element) -> list[dict[str, Any]]:
+    # podryk itself writes `<chapter>` without namespace inside `<psc:chapters>`, other feeds use `<psc:chapter>`
+    return [
+        _without_none(
+            {
+                "start": _duration(chapter.get("start")),
+                "title": chapter.get("title"),
+                "href": chapter.get("href"),
+                "image": chapter.get("image"),
+            }
+        )
+        for chapter in chapters
+        if chapter.tag in ("chapter", _tag(Namespace.CHAPTERS, "chapter"))
+    ]
+
+
+def _categories(channel: etree._Element) -> list[PodcastCategory]:
+    """
+    Map the `<itunes:category>` tree onto `PodcastCategory`.
+
+    Unknown sub-categories fall back to their parent category, unknown categories are skipped.
+    """
+    results = []
+    for category in channel.iterchildren(_ITUNES_CATEGORY):
+        name = category.get("text")
+        sub_categories = [sub_category.get("text") for sub_category in category.iterchildren(_ITUNES_CATEGORY)]
+
+        for sub_category_name in sub_categories or [None]:
+            for names in ((name, sub_category_name), (name, None)):
+                try:
+                    member = PodcastCategory.from_names(*names)
+                except ValueError:
+                    continue
+                if member not in results:
+                    results.append(member)
+                break
+    return results
@@ -0,0 +1,255 @@
+"""
+Columnar episode data as a rendering source.
+
+An `EpisodeTable` holds one list (or array) per episode field. Each column is validated in a single pass, and the
+compiled serializer renders the rows through a reused view object, so no `Episode` model is created per row.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from datetime import datetime, timedelta
+from typing import Any, overload
+from uuid import UUID
+
+from podryk.models.enum import EpisodeType
+from podryk.models.episode import Episode
+from podryk.models.sub_types import Enclosure, Guid
+from podryk.models.validators import is_http_url, is_media_type, media_type_from_url
+
+_REQUIRED_COLUMNS = ("title", "guid", "enclosure_url", "enclosure_length")
+_OPTIONAL_COLUMNS = (
+    "guid_is_permalink",
+    "enclosure_type",
+    "link",
+    "publication_date",
+    "description",
+    "duration",
+    "image",
+    "explicit",
+    "season_number",
+    "episode_number",
+    "type",
+    "block",
+)
+_NESTED_COLUMNS = {
+    "guid": {"guid": "guid", "is_permalink": "guid_is_permalink"},
+    "enclosure": {"url": "enclosure_url", "length": "enclosure_length", "type": "enclosure_type"},
+}
+"""Attributes of the nested `Guid` and `Enclosure` per column."""
+
+_MAX_DESCRIPTION_BYTES = 4000
+
+
+class EpisodeTable(Sequence[Episode]):
+    """
+    Episodes given as columns, e.g. `{"title": [...], "guid": [...], "enclosure_url": [...], ...}`.
+
+    Columns are named like the fields of `CompactEpisode`; `title`, `guid`, `enclosure_url` and `enclosure_length`
+    are required. Durations are given in seconds (or as `timedelta`), missing enclosure types are inferred from the
+    URL, and missing `guid_is_permalink` values are derived from the GUIDs like in `Guid`. Transcripts and chapters
+    aren't supported.
+
+    The table can be passed as `Podcast.episodes`. Its feed is always rendered with the compiled serializer and
+    without the fragment cache. Accessing an item builds an `Episode` for that row.
+    """
+
+    def __init__(self, columns: Mapping[str, Sequence[Any]]):
+        self._columns = _validate_columns(columns)
+        self._length = len(self._columns["title"])
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> Episode: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Episode]: ...
+
+    def __getitem__(self, index: int | slice) -> Episode | list[Episode]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(self._length))]
+
+        row = self._columns_at(range(self._length)[index])
+        return Episode.model_construct(
+            **{name: value for name, value in row.items() if name not in ("guid", "enclosure")},
+            guid=Guid.model_construct(**row["guid"]),
+            enclosure=Enclosure.model_construct(**row["enclosure"]),
+        )
+
+    def column(self, name: str) -> list[Any] | None:
+        """The validated values of a column, `None` if the table doesn't have the column."""
+        return self._columns.get(name)
+
+    def rows(self) -> Iterator[Any]:
+        """
+        Yield a view of each row with the attributes of an `Episode`, for the compiled serializer.
+
+        The same view object is reused for every row, so it is only valid until the next row is requested.
+        """
+        nested = {
+            attribute: _RowView(model, {name: self._columns.get(column) for name, column in columns.items()})
+            for attribute, (model, columns) in {
+                "guid": (Guid, _NESTED_COLUMNS["guid"]),
+                "enclosure": (Enclosure, _NESTED_COLUMNS["enclosure"]),
+            }.items()
+        }
+        view = _RowView(Episode, self._columns, nested)
+        for index in range(self._length):
+            view.index = index
+            yield view
+
+    def _columns_at(self, index: int) -> dict[str, Any]:
+        row = {name: self._columns[name][index] if name in self._columns else None for name in Episode.model_fields}
+        for attribute, columns in _NESTED_COLUMNS.items():
+            row[attribute] = {name: self._columns[column][index] for name, column in columns.items()}
+        return row
+
+
+class _RowView:
+    """Attribute access to the values of a single row, serialized with the plan of `model` by `podryk.compiled`."""
+
+    __slots__ = ("__podryk_model__", "_columns", "_nested", "index")
+
+    def __init__(
+        self, model: type, columns: Mapping[str, list[Any] | None], nested: Mapping[str, _RowView] | None = None
+    ):
+        self.__podryk_model__ = model
+        self._columns = columns
+        self._nested = nested or {}
+        self.index = 0
+
+    def __getattr__(self, name: str) -> Any:
+        nested = self._nested.get(name)
+        if nested is not None:
+            nested.index = self.index
+            return nested
+
+        column = self._columns.get(name)
+        return None if column is None else column[self.index]
+
+
+def _validate_columns(columns: Mapping[str, Sequence[Any]]) -> dict[str, list[Any]]:
+    """Check and normalize every column in a single pass over its values."""
+    unknown = set(columns) - {*_REQUIRED_COLUMNS, *_OPTIONAL_COLUMNS}
+    if unknown:
+        raise ValueError(f"Unknown episode columns: {', '.join(sorted(unknown))}")
+
+    missing = [name for name in _REQUIRED_COLUMNS if name not in columns]
+    if missing:
+        raise ValueError(f"Missing episode columns: {', '.join(missing)}")
+
+    # Arrays (e.g. numpy) are converted to lists of python values
+    result = {name: column.tolist() if hasattr(column, "tolist") else list(column) for name, column in columns.items()}
+
+    lengths = {name: len(column) for name, column in result.items()}
+    if len(set(lengths.values())) > 1:
+        raise ValueError(f"Episode columns differ in length: {lengths}")
+    if not lengths["title"]:
+        raise ValueError("Episode table is empty")
+
+    if "enclosure_type" not in result:
+        result["enclosure_type"] = [None] * lengths["title"]
+    result["enclosure_type"] = [
+        media_type if media_type is not None else media_type_from_url(url)
+        for url, media_type in zip(result["enclosure_url"], result["enclosure_type"])
+    ]
+
+    if "guid_is_permalink" not in result:
+        result["guid_is_permalink"] = [None] * lengths["title"]
+    result["guid_is_permalink"] = [
+        is_permalink if is_permalink is not None else (None if is_http_url(guid) else False)
+        for guid, is_permalink in zip(result["guid"], result["guid_is_permalink"])
+    ]
+
+    if "duration" in result:
+        result["duration"] = [_timedelta(value) for value in result["duration"]]
+
+    errors = [
+        *_check(result, "title", lambda value: isinstance(value, str), "must be a string"),
+        *_check(result, "guid", lambda value: isinstance(value, (str, UUID)), "must be a string or UUID"),
+        *_check(result, "guid_is_permalink", _is_bool_or_none, "must be a boolean"),
+        *_check(result, "enclosure_url", lambda value: isinstance(value, str), "must be a string"),
+        *_check(result, "enclosure_length", _is_integer, "must be an integer"),
+        *_check(result, "enclosure_type", lambda value: value is not None and is_media_type(value), "unknown type"),
+        *_check(result, "link", _is_url_or_none, "must be an HTTP(S) URL"),
+        *_check(result, "image", _is_url_or_none, "must be an HTTP(S) URL"),
+        *_check(result, "duration", _is_duration_or_none, "must be positive"),
+        *_check(result, "publication_date", _is_aware_or_none, "must be a datetime with time zone"),
+        *_check(result, "description", _fits_description, f"exceeds {_MAX_DESCRIPTION_BYTES} bytes"),
+        *_check(result, "explicit", _is_bool_or_none, "must be a boolean"),
+        *_check(result, "block", _is_bool_or_none, "must be a boolean"),
+        *_check(result, "season_number", _is_positive_or_none, "must be a positive integer"),
+        *_check(result, "episode_number", _is_positive_or_none, "must be a positive integer"),
+        *_check(result, "type", _is_episode_type_or_none, "unknown episode type"),
+        *_duplicates(result, "guid"),
+        *_duplicates(result, "enclosure_url"),
+    ]
+    if errors:
+        raise ValueError(f"Invalid episode table ({'; '.join(errors)})")
+
+    if "type" in result:
+        result["type"] = [None if value is None else EpisodeType(value) for value in result["type"]]
+
+    return result
+
+
+def _check(columns: dict[str, list[Any]], name: str, valid: Callable[[Any], bool], message: str) -> list[str]:
+    column = columns.get(name)
+    if column is None:
+        return []
+    return [f"{name}[{index}]: {message}" for index, value in enumerate(column) if not valid(value)]
+
+
+def _duplicates(columns: dict[str, list[Any]], name: str) -> list[str]:
+    seen = set()
+    errors = []
+    for index, value in enumerate(columns[name]):
+        key = str(value)
+        if key in seen:
+            errors.append(f"{name}[{index}]: duplicate {key}")
+        seen.add(key)
+    return errors
+
+
+def _timedelta(value: timedelta | float | None) -> timedelta | None:
+    # Other values are rejected by `_is_duration_or_none`
+    return timedelta(seconds=value) if _is_number(value) else value
+
+
+def _is_number(value: Any) -> bool:
+    # `bool` is a subclass of `int`, but `True` isn't a number of seconds (or an episode number)
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_bool_or_none(value: Any) -> bool:
+    return value is None or isinstance(value, bool)
+
+
+def _is_url_or_none(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and is_http_url(value))
+
+
+def _is_duration_or_none(value: Any) -> bool:
+    return value is None or (isinstance(value, timedelta) and value >= timedelta())
+
+
+def _is_aware_or_none(value: Any) -> bool:
+    return value is None or (isinstance(value, datetime) and value.utcoffset() is not None)
+
+
+def _fits_description(value: str | None) -> bool:
+    return value is None or (isinstance(value, str) and len(value.encode()) <= _MAX_DESCRIPTION_BYTES)
+
+
+def _is_positive_or_none(value: Any) -> bool:
+    return value is None or (_is_integer(value) and value > 0)
+
+
+def _is_episode_type_or_none(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and value in EpisodeType._value2member_map_)
@@ -0,0 +1,25 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True, slots=True)
+class DroppedEpisode:
+    """An episode that was left out of a feed to stay within its size limit."""
+
+    index: int
+    """Position of the episode in the feed, i.e. in `Podcast.episodes` unless it is listed in episode number order."""
+
+    guid: str
+
+
+@dataclass(frozen=True, slots=True)
+class TrimmedFeed:
+    """A feed rendered with as many of the newest episodes as fit into a size limit."""
+
+    feed: bytes
+    dropped_episodes: list[DroppedEpisode] = field(default_factory=list)
+    """The left out episodes, in feed order."""
+
+    @property
+    def complete(self) -> bool:
+        """Whether all episodes fit."""
+        return not self.dropped_episodes
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from pydantic import ValidationError
+from pydantic_core import ErrorDetails
+
+from podryk.collection import episode_guid
+from podryk.compact import CompactEpisode
+from podryk.models.episode import Episode
+from podryk.models.sub_types import Guid
+
+if TYPE_CHECKING:
+    from podryk.models.podcast import Podcast
+
+
+@dataclass(frozen=True, slots=True)
+class InvalidEpisode:
+    """An episode that was left out of a partially validated podcast."""
+
+    index: int
+    """Position of the episode in the input."""
+
+    guid: str | None
+    """The GUID of the episode, if the input has one."""
+
+    errors: list[ErrorDetails]
+    """The validation errors, as returned by `ValidationError.errors()`."""
+
+
+@dataclass(frozen=True, slots=True)
+class PartialPodcast:
+    podcast: Podcast
+    """The podcast with all valid episodes, in input order."""
+
+    invalid_episodes: list[InvalidEpisode] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.invalid_episodes
+
+
+class UniquenessIndex:
+    """Set-based index of episode GUIDs and enclosure URLs, to find duplicates in O(n) over all episodes."""
+
+    def __init__(self):
+        self._guids: set[str] = set()
+        self._urls: set[str] = set()
+
+    def duplicates(self, episode: Episode | CompactEpisode) -> list[ErrorDetails]:
+        """Errors for the fields of `episode` that an already added episode has as well."""
+        errors = []
+        guid, url = _unique_keys(episode)
+        if guid in self._guids:
+            errors.append(_duplicate_error(("guid", "guid"), "GUID", guid))
+        if url in self._urls:
+            errors.append(_duplicate_error(("enclosure", "url"), "enclosure URL", url))
+        return errors
+
+    def add(self, episode: Episode | CompactEpisode) -> None:
+        guid, url = _unique_keys(episode)
+        self._guids.add(guid)
+        self._urls.add(url)
+
+
+def check_unique_episodes(episodes: Sequence[Episode | CompactEpisode]) -> Sequence[Episode | CompactEpisode]:
+    """Raise a `ValueError` listing every episode with the GUID or enclosure URL of a previous episode."""
+    index = UniquenessIndex()
+    messages = []
+    for position, episode in enumerate(episodes):
+        messages.extend(f"episode {position}: {error['msg']}" for error in index.duplicates(episode))
+        index.add(episode)
+
+    if messages:
+        raise ValueError(f"Episodes must have unique GUIDs and enclosure URLs ({'; '.join(messages)})")
+    return episodes
+
+
+def validate_partial(data: Mapping[str, Any]) -> PartialPodcast:
+    """Validate a podcast and leave out invalid episodes. See `Podcast.validate_partial`."""
+    from podryk.models.podcast import Podcast
+
+    episodes, invalid_episodes = [], []
+    uniqueness = UniquenessIndex()
+    for index, episode in enumerate(data.get("episodes", [])):
+        try:
+            episode = Episode.model_validate(episode)
+        except ValidationError as error:
+            errors = error.errors(include_url=False)
+        else:
+            errors = uniqueness.duplicates(episode)
+
+        if errors:
+            invalid_episodes.append(InvalidEpisode(index=index, guid=_guid(episode), errors=errors))
+        else:
+            uniqueness.add(episode)
+            episodes.append(episode)
+
+    # Episodes are validated already, so they are not validated a second time
+    podcast = Podcast.model_validate({**data, "episodes": episodes})
+    return PartialPodcast(podcast=podcast, invalid_episodes=invalid_episodes)
+
+
+def _unique_keys(episode: Episode | CompactEpisode) -> tuple[str, str]:
+    if isinstance(episode, CompactEpisode):
+        return str(episode.guid), episode.enclosure_url
+    return episode_guid(episode), episode.enclosure.url
+
+
+def _duplicate_error(location: tuple[str, ...], name: str, value: str) -> ErrorDetails:
+    return ErrorDetails(type="duplicate", loc=location, msg=f"Duplicate {name}: {value}", input=value)
+
+
+def _guid(episode: Any) -> str | None:
+    guid = episode.get("guid") if isinstance(episode, Mapping) else getattr(episode, "guid", None)
+    if isinstance(guid, Mapping):
+        guid = guid.get("guid")
+    elif isinstance(guid, Guid):
+        guid = guid.guid
+    return None if guid is None else str(guid)
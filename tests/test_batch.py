@@ -0,0 +1,90 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+from pydantic import ValidationError
+
+from podryk import Podcast, render_feeds
+
+from .utils.podcasts import make_podcast, podcast_data
+
+
+def test_render_feeds_in_order():
+    podcasts = [make_podcast(episode_count) for episode_count in (1, 2, 3)]
+    results = list(render_feeds(podcasts, workers=2))
+
+    assert [result.index for result in results] == [0, 1, 2]
+    assert [result.feed for result in results] == [podcast.to_feed() for podcast in podcasts]
+
+
+def test_render_feeds_from_data():
+    data = podcast_data(1)
+    (result,) = render_feeds([data], workers=1, compiled=True)
+
+    assert result.ok
+    assert result.feed == Podcast.model_validate(data).to_feed()
+
+
+def test_render_feeds_reports_failures():
+    podcasts = [make_podcast(1), {"title": "Missing fields"}, make_podcast(2)]
+    results = sorted(render_feeds(podcasts, ordered=False, executor=ThreadPoolExecutor(2)), key=lambda r: r.index)
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, ValidationError)
+    assert results[1].feed is None
+
+
+class _Unpicklable(dict):
+    def __reduce__(self):
+        raise TypeError("cannot pickle this podcast")
+
+
+class _KillsWorker(dict):
+    def __reduce__(self):
+        # Unpickling the podcast in the worker process ends the process
+        return os._exit, (1,)
+
+
+def test_render_feeds_reports_executor_failures():
+    podcasts = [make_podcast(1), _Unpicklable(title="Podcast title")]
+    results = list(render_feeds(podcasts, workers=1))
+
+    assert [result.ok for result in results] == [True, False]
+    assert isinstance(results[1].error, TypeError)
+
+
+def test_render_feeds_survives_broken_pool():
+    podcasts = [_KillsWorker(), make_podcast(1), make_podcast(2)]
+    results = list(render_feeds(podcasts, workers=1))
+
+    assert [result.index for result in results] == [0, 1, 2]
+    assert isinstance(results[0].error, BrokenProcessPool)
+
+
+class _FailingPodcast(Podcast):
+    def to_feed(self, *args, **kwargs) -> bytes:
+        raise ZeroDivisionError("unexpected error")
+
+
+def test_render_feeds_reports_unexpected_errors():
+    podcasts = [_FailingPodcast.model_validate(dict(make_podcast(1))), make_podcast(1)]
+    results = list(render_feeds(podcasts, executor=ThreadPoolExecutor(1)))
+
+    assert [result.ok for result in results] == [False, True]
+    assert isinstance(results[0].error, ZeroDivisionError)
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_render_feeds_submits_podcasts_in_windows(ordered: bool):
+    consumed = []
+
+    def podcasts():
+        for index in range(10):
+            consumed.append(index)
+            yield make_podcast(1)
+
+    results = render_feeds(podcasts(), ordered=ordered, executor=ThreadPoolExecutor(1), max_pending=3)
+    first = next(results)
+    assert len(consumed) == 3
+    assert sorted(result.index for result in [first, *results]) == list(range(10))
@@ -0,0 +1,66 @@
+from unittest import mock
+
+from podryk import DiskFragmentCache, MemoryFragmentCache
+from podryk.cache import fragment_key
+
+from .utils.podcasts import make_podcast
+
+
+class TestFragmentKey:
+    def test_stable(self):
+        assert fragment_key(make_podcast(1).episodes[0]) == fragment_key(make_podcast(1).episodes[0])
+
+    def test_changes_with_fields(self):
+        episode = make_podcast(1).episodes[0]
+        changed = episode.model_copy(update={"title": "Other title"})
+        assert fragment_key(episode) != fragment_key(changed)
+
+    def test_changes_with_chapters(self):
+        episode = make_podcast(1).episodes[0]
+        changed = episode.model_copy(update={"chapters": None})
+        assert fragment_key(episode) != fragment_key(changed)
+
+
+class TestMemoryFragmentCache:
+    def test_evicts_least_recently_used(self):
+        cache = MemoryFragmentCache(max_bytes=10)
+        cache.set("a", b"1234")
+        cache.set("b", b"1234")
+        cache.get("a")
+        cache.set("c", b"1234")
+
+        assert cache.get("a") == b"1234"
+        assert cache.get("b") is None
+        assert cache.get("c") == b"1234"
+        assert cache.size == 8
+
+    def test_skips_oversized_fragments(self):
+        cache = MemoryFragmentCache(max_bytes=2)
+        cache.set("a", b"123")
+        assert len(cache) == 0
+
+
+def test_disk_fragment_cache(tmp_path):
+    cache = DiskFragmentCache(tmp_path)
+    assert cache.get("abcdef") is None
+    cache.set("abcdef", b"<item/>")
+    assert cache.get("abcdef") == b"<item/>"
+
+
+def test_feed_with_cache_matches_feed(tmp_path):
+    for cache in (MemoryFragmentCache(), DiskFragmentCache(tmp_path)):
+        podcast = make_podcast(5)
+        assert podcast.to_feed(cache=cache) == podcast.to_feed()
+        assert podcast.to_feed(cache=cache) == podcast.to_feed()
+
+
+def test_feed_reuses_unchanged_episodes():
+    cache = MemoryFragmentCache()
+    podcast = make_podcast(5)
+    podcast.to_feed(cache=cache)
+
+    podcast.episodes[0] = podcast.episodes[0].model_copy(update={"title": "Changed"})
+    with mock.patch("podryk.models.podcast._ItemWriter._render", autospec=True, return_value=b"<item/>") as render:
+        podcast.to_feed(cache=cache)
+
+    assert render.call_count == 1
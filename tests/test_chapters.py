@@ -0,0 +1,88 @@
+import json
+from datetime import timedelta
+
+import pytest
+from pydantic import ValidationError
+
+from podryk import Chapter, ChaptersLink, CompactEpisodes, Podcast
+from podryk.chapters import chapters_json
+from podryk.models.validators import is_media_type
+
+from .utils.podcasts import make_podcast
+
+_URL = "https://example.com/chapters/{name}"
+
+
+def test_chapters_json():
+    chapters = [
+        Chapter(start=timedelta(seconds=0), title="Intro"),
+        Chapter(start=timedelta(minutes=1, milliseconds=500), title="Über", href="https://example.com", image=None),
+    ]
+    assert json.loads(chapters_json(chapters)) == {
+        "version": "1.2.0",
+        "chapters": [
+            {"startTime": 0.0, "title": "Intro"},
+            {"startTime": 60.5, "title": "Über", "url": "https://example.com"},
+        ],
+    }
+
+
+def test_chapters_link_type():
+    assert ChaptersLink(url="https://example.com/chapters.json").type == "application/json+chapters"
+    with pytest.raises(ValidationError):
+        ChaptersLink(url="https://example.com/chapters.json", type="application/json")
+    # Not accepted as media type of other links
+    assert not is_media_type("application/json+chapters")
+
+
+def test_feed_links_to_chapter_files(tmp_path):
+    result = make_podcast(2).externalize_chapters(tmp_path, _URL)
+
+    assert sorted(result.written) == sorted(tmp_path.iterdir())
+    assert len(result.written) == 2
+
+    episode = result.podcast.episodes[0]
+    name = episode.chapters_link.url.rsplit("/", 1)[1]
+    assert json.loads((tmp_path / name).read_bytes())["chapters"] == [{"startTime": 1.0, "title": "Intro"}]
+
+    feed = result.podcast.to_feed()
+    assert result.podcast.to_feed(compiled=True) == feed
+    assert b"<psc:chapters" not in feed
+    assert f'<podcast:chapters url="{episode.chapters_link.url}" type="application/json+chapters"/>'.encode() in feed
+
+
+def test_only_changed_files_are_written(tmp_path):
+    podcast = make_podcast(3)
+    podcast.externalize_chapters(tmp_path, _URL)
+
+    assert podcast.externalize_chapters(tmp_path, _URL).written == []
+
+    episode = podcast.episodes[1]
+    changed = episode.model_copy(update={"chapters": [Chapter(start=timedelta(), title="Changed")]})
+    podcast = podcast.model_copy(update={"episodes": [podcast.episodes[0], changed, podcast.episodes[2]]})
+    result = podcast.externalize_chapters(tmp_path, _URL)
+
+    assert result.written == [tmp_path / result.podcast.episodes[1].chapters_link.url.rsplit("/", 1)[1]]
+
+
+def test_episodes_without_chapters(tmp_path):
+    podcast = make_podcast(1)
+    podcast = podcast.model_copy(update={"episodes": [podcast.episodes[0].model_copy(update={"chapters": None})]})
+
+    result = podcast.externalize_chapters(tmp_path, _URL)
+    assert result.podcast is podcast
+    assert result.written == []
+
+
+def test_compact_episodes_and_parsing(tmp_path):
+    podcast = make_podcast(2)
+    podcast = podcast.model_copy(update={"episodes": CompactEpisodes(podcast.episodes)})
+
+    result = podcast.externalize_chapters(tmp_path, _URL)
+    assert isinstance(result.podcast.episodes, CompactEpisodes)
+    link = result.podcast.episodes[0].chapters_link
+    assert isinstance(link, ChaptersLink)
+
+    parsed = Podcast.from_feed(result.podcast.to_feed())
+    assert parsed.episodes[0].chapters_link == link
+    assert parsed.episodes[0].chapters is None
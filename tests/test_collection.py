@@ -0,0 +1,102 @@
+import pytest
+from pydantic import ValidationError
+
+from podryk import EpisodeCollection, PodcastType
+
+from .utils.podcasts import make_podcast
+
+
+def test_sorted_by_publication_date():
+    episodes = make_podcast(5).episodes
+    collection = EpisodeCollection([episodes[2], episodes[0], episodes[4], episodes[1], episodes[3]])
+
+    assert list(collection) == episodes[::-1]
+    assert collection[0] is episodes[4]
+    assert collection == episodes[::-1]
+
+
+def test_episodes_without_date_are_last():
+    episodes = make_podcast(2).episodes
+    undated = episodes[0].model_copy(update={"publication_date": None})
+
+    assert list(EpisodeCollection([undated, episodes[1]])) == [episodes[1], undated]
+
+
+def test_lookup_and_replace_by_guid():
+    episodes = make_podcast(3).episodes
+    collection = EpisodeCollection(episodes)
+
+    assert collection.get("episode-2") is episodes[1]
+    assert collection.get("missing") is None
+    assert episodes[1] in collection
+
+    updated = episodes[1].model_copy(update={"title": "Updated", "publication_date": None})
+    assert collection.add(updated) is episodes[1]
+    assert len(collection) == 3
+    assert collection.get("episode-2") is updated
+    assert collection[-1] is updated
+    assert episodes[1] not in collection
+
+    assert collection.remove("episode-2") is updated
+    assert list(collection) == [episodes[2], episodes[0]]
+    with pytest.raises(KeyError):
+        collection.remove("episode-2")
+
+
+def test_lookup_by_number():
+    episodes = [
+        episode.model_copy(update={"season_number": season, "episode_number": number})
+        for episode, (season, number) in zip(make_podcast(4).episodes, [(2, 1), (1, 2), (1, 1), (None, None)])
+    ]
+    collection = EpisodeCollection(episodes)
+
+    assert collection.get_by_number(2, season_number=1) is episodes[1]
+    assert collection.get_by_number(1, season_number=2) is episodes[0]
+    assert collection.get_by_number(3) is None
+    assert collection.in_number_order() == [episodes[2], episodes[1], episodes[0], episodes[3]]
+
+    collection.remove(str(episodes[1].guid.guid))
+    assert collection.get_by_number(2, season_number=1) is None
+
+
+def test_remove_modified_episode():
+    episodes = make_podcast(3).episodes
+    collection = EpisodeCollection(episodes)
+
+    # The sort key changes after the episode was added
+    episodes[1].publication_date = None
+    assert collection.remove("episode-2") is episodes[1]
+    assert list(collection) == [episodes[2], episodes[0]]
+
+
+def test_accepted_by_podcast_without_copying():
+    podcast = make_podcast(3)
+    collection = EpisodeCollection(podcast.episodes)
+
+    indexed = podcast.model_validate({**dict(podcast), "episodes": collection})
+
+    assert indexed.episodes is collection
+    assert indexed.to_feed() == podcast.model_copy(update={"episodes": list(collection)}).to_feed()
+    assert b"".join(indexed.iter_feed_chunks()) == indexed.to_feed()
+
+
+def test_empty_collection_is_rejected():
+    podcast = make_podcast(1)
+    with pytest.raises(ValidationError):
+        podcast.model_validate({**dict(podcast), "episodes": EpisodeCollection()})
+
+
+def test_serial_podcast_in_number_order():
+    podcast = make_podcast(3)
+    episodes = [
+        episode.model_copy(update={"episode_number": number}) for episode, number in zip(podcast.episodes, [2, 3, 1])
+    ]
+    serial = podcast.model_validate(
+        {**dict(podcast), "type": PodcastType.SERIAL, "episodes": EpisodeCollection(episodes)}
+    )
+
+    expected = podcast.model_copy(
+        update={"type": PodcastType.SERIAL, "episodes": [episodes[2], episodes[0], episodes[1]]}
+    ).to_feed()
+    assert serial.to_feed() == expected
+    assert b"".join(serial.iter_feed_chunks()) == expected
@@ -0,0 +1,44 @@
+import io
+
+import pytest
+from pydantic import ValidationError
+
+from podryk import CompactEpisode, CompactEpisodes
+
+from .utils.memory import allocated_per_item
+from .utils.podcasts import make_podcast
+
+
+def test_round_trip():
+    for episode in make_podcast(3).episodes:
+        assert CompactEpisode.from_episode(episode).to_episode() == episode
+
+
+def test_podcast_with_compact_episodes():
+    podcast = make_podcast(5)
+    compact = podcast.model_validate({**dict(podcast), "episodes": CompactEpisodes(podcast.episodes)})
+
+    assert isinstance(compact.episodes, CompactEpisodes)
+    assert compact.to_feed() == podcast.to_feed()
+
+    file = io.BytesIO()
+    compact.write_feed(file, compiled=True)
+    assert file.getvalue() == podcast.to_feed()
+
+
+def test_duplicate_compact_episodes_are_rejected():
+    podcast = make_podcast(2)
+    episodes = CompactEpisodes([podcast.episodes[0], podcast.episodes[1], podcast.episodes[0]])
+
+    with pytest.raises(ValidationError, match="episode 2: Duplicate GUID: episode-1"):
+        podcast.model_validate({**dict(podcast), "episodes": episodes})
+
+
+def test_memory_per_episode():
+    episodes = make_podcast(500).episodes
+
+    # Strings are shared with the source episodes, so only the overhead of each representation is measured
+    model_size = allocated_per_item(lambda: [episode.model_copy(deep=True) for episode in episodes])
+    compact_size = allocated_per_item(lambda: [CompactEpisode.from_episode(episode) for episode in episodes])
+
+    assert compact_size < model_size / 4, f"{compact_size:.0f} vs. {model_size:.0f} bytes per episode"
@@ -0,0 +1,40 @@
+import pytest
+
+from podryk import MemoryFragmentCache, PodcastCategory
+from podryk.compiled import to_xml_tree
+
+from .utils.podcasts import make_podcast
+
+
+@pytest.mark.parametrize("episode_count", [1, 10])
+def test_compiled_feed_matches_feed(episode_count: int):
+    podcast = make_podcast(episode_count)
+    assert podcast.to_feed(compiled=True) == podcast.to_feed()
+
+
+def test_compiled_feed_with_all_categories():
+    podcast = make_podcast(1).model_copy(update={"categories": list(PodcastCategory)})
+    assert podcast.to_feed(compiled=True) == podcast.to_feed()
+
+
+def test_compiled_chunks_match_feed():
+    podcast = make_podcast(3)
+    assert b"".join(podcast.iter_feed_chunks(cache=MemoryFragmentCache(), compiled=True)) == podcast.to_feed()
+
+
+def test_missing_pydantic_xml_internals_fail_loudly():
+    class Row:
+        # A model class without the pydantic-xml internals the plans are built from
+        __podryk_model__ = type("Model", (), {})
+
+    with pytest.raises(RuntimeError, match="Unsupported pydantic-xml version .*, can't build the plan for Model"):
+        to_xml_tree(Row())
+
+
+def test_compiled_wrapped_fields():
+    podcast = make_podcast(1)
+    feed = podcast.to_feed(compiled=True)
+
+    # `wrapped()` fields like `image` carry several entities, the element and the attribute inside it
+    assert b'<itunes:image href="' in feed
+    assert b'<channel href="' not in feed
@@ -0,0 +1,57 @@
+import gzip
+import hashlib
+from datetime import UTC, datetime
+
+import pytest
+
+from podryk.compression import available_encodings, compress_feed
+
+from .utils.podcasts import make_podcast
+
+
+def test_gzip_feed():
+    podcast = make_podcast(3)
+    compressed = podcast.to_compressed_feed()
+    feed = podcast.to_feed()
+
+    assert gzip.decompress(compressed.content) == feed
+    assert compressed.content_hash == hashlib.sha256(feed).hexdigest()
+    assert compressed.etag == f'"{compressed.content_hash}-gzip"'
+    assert compressed.headers["Content-Encoding"] == "gzip"
+
+
+def test_gzip_feed_is_deterministic():
+    assert make_podcast(3).to_compressed_feed().content == make_podcast(3).to_compressed_feed().content
+
+
+def test_identity_feed():
+    podcast = make_podcast(2)
+    compressed = podcast.to_compressed_feed("identity")
+
+    assert compressed.content == podcast.to_feed()
+    assert compressed.etag == f'"{compressed.content_hash}"'
+    assert "Content-Encoding" not in compressed.headers
+
+
+def test_last_modified():
+    compressed = make_podcast(3).to_compressed_feed()
+
+    assert compressed.last_modified == datetime(2020, 1, 4, tzinfo=UTC)
+    assert compressed.headers["Last-Modified"] == "Sat, 04 Jan 2020 00:00:00 GMT"
+
+
+@pytest.mark.parametrize("encoding", [encoding for encoding in ("br", "zstd") if encoding in available_encodings()])
+def test_optional_encodings(encoding: str):
+    podcast = make_podcast(2)
+    compressed = podcast.to_compressed_feed(encoding)
+    assert compressed.headers["Content-Encoding"] == encoding
+
+    if encoding == "br":
+        from podryk.compression import brotli
+
+        assert brotli.decompress(compressed.content) == podcast.to_feed()
+
+
+def test_unknown_encoding():
+    with pytest.raises(ValueError):
+        compress_feed([b""], "deflate64")
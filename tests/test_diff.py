@@ -0,0 +1,37 @@
+from podryk import diff_feeds, diff_podcasts
+
+from .utils.podcasts import make_podcast
+
+
+def test_no_changes():
+    diff = diff_podcasts(make_podcast(3), make_podcast(3))
+    assert not diff.changed
+
+
+def test_episode_changes():
+    old = make_podcast(4)
+    new = make_podcast(5)
+    del new.episodes[0]
+    new.episodes[1] = new.episodes[1].model_copy(update={"title": "New title", "chapters": None})
+
+    diff = diff_podcasts(old, new)
+
+    assert diff.changed
+    assert diff.channel_fields == []
+    assert [episode.guid.guid for episode in diff.added] == ["episode-5"]
+    assert [episode.guid.guid for episode in diff.removed] == ["episode-1"]
+    assert [(change.new.guid.guid, change.fields) for change in diff.modified] == [("episode-3", ["title", "chapters"])]
+    assert diff.modified[0].old == old.episodes[2]
+
+
+def test_channel_changes():
+    new = make_podcast(2).model_copy(update={"title": "New title", "canonical_link": "https://example.com/new.rss"})
+    diff = diff_podcasts(make_podcast(2), new)
+
+    assert diff.channel_fields == ["canonical_link", "title"]
+    assert not diff.added and not diff.removed and not diff.modified
+
+
+def test_diff_feeds():
+    diff = diff_feeds(make_podcast(2).to_feed(), make_podcast(3).to_feed())
+    assert [episode.guid.guid for episode in diff.added] == ["episode-3"]
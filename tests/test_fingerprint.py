@@ -0,0 +1,71 @@
+import re
+from unittest import mock
+
+from podryk.models.namespaces import NAMESPACES
+
+from .utils.podcasts import make_podcast
+
+
+def test_fingerprint_is_stable():
+    assert make_podcast(3).fingerprint() == make_podcast(3).fingerprint()
+
+
+def test_fingerprint_changes_with_episodes():
+    podcast = make_podcast(3)
+    changed = make_podcast(3)
+    changed.episodes[2] = changed.episodes[2].model_copy(update={"chapters": None})
+
+    assert podcast.fingerprint() != changed.fingerprint()
+    assert podcast.fingerprint() != make_podcast(4).fingerprint()
+
+
+def test_fingerprint_changes_with_excluded_fields():
+    podcast = make_podcast(1)
+    assert (
+        podcast.fingerprint()
+        != podcast.model_copy(update={"canonical_link": "https://example.com/other"}).fingerprint()
+    )
+    assert podcast.fingerprint() != podcast.model_copy(update={"categories": []}).fingerprint()
+
+
+def test_render_if_changed():
+    fingerprint, feed = make_podcast(2).render_if_changed(None)
+    assert feed == make_podcast(2).to_feed()
+
+    with mock.patch("podryk.models.podcast.Podcast.to_feed") as to_feed:
+        assert make_podcast(2).render_if_changed(fingerprint) == (fingerprint, None)
+    to_feed.assert_not_called()
+
+    new_fingerprint, feed = make_podcast(3).render_if_changed(fingerprint)
+    assert new_fingerprint != fingerprint
+    assert feed == make_podcast(3).to_feed()
+
+
+def test_render_options_change_fingerprint():
+    fingerprint, _ = make_podcast(2).render_if_changed(None)
+
+    minimal, feed = make_podcast(2).render_if_changed(fingerprint, minimal_namespaces=True)
+    assert minimal != fingerprint
+    assert feed == make_podcast(2).to_feed(minimal_namespaces=True)
+    assert make_podcast(2).render_if_changed(minimal, minimal_namespaces=True) == (minimal, None)
+    assert make_podcast(2).render_if_changed(fingerprint, compiled=True) == (fingerprint, None)
+
+
+def test_deterministic_serialization():
+    """Equal fingerprints must result in equal feeds, so the output may not depend on e.g. construction order."""
+    podcast = make_podcast(2)
+    reordered = type(podcast).model_validate(dict(reversed(list(dict(podcast).items()))))
+
+    assert reordered.fingerprint() == podcast.fingerprint()
+    assert reordered.to_feed() == podcast.to_feed()
+    assert podcast.to_feed(compiled=True) == podcast.to_feed()
+
+
+def test_stable_namespace_and_attribute_order():
+    feed = make_podcast(1).to_feed().decode()
+
+    declarations = re.search(r"<rss ([^>]*)>", feed).group(1)
+    assert re.findall(r'xmlns:(\w+)="([^"]+)"', declarations) == list(NAMESPACES.items())
+    assert declarations.endswith('version="2.0"')
+    assert '<enclosure url="https://example.com/1.mp3" length="30001" type="audio/mpeg"/>' in feed
+    assert '<atom:link href="https://example.com/feed.rss" rel="self" type="application/rss+xml"/>' in feed
@@ -0,0 +1,120 @@
+import json
+import subprocess
+import sys
+from typing import Any
+
+import podryk
+from podryk.models.xml_model import XmlModel
+
+_HEAVY_MODULES = ["pydantic", "pydantic_xml", "lxml.etree", "content_types"]
+_FEATURE_MODULES = [
+    "podryk.cache",
+    "podryk.chapters",
+    "podryk.compiled",
+    "podryk.compression",
+    "podryk.paging",
+    "podryk.parsing",
+    "podryk.trimming",
+]
+_ITEM = (
+    b"<item><title>Episode title</title>"
+    b'<enclosure url="https://example.com/audio.mp3" length="30000" type="audio/mpeg"/>'
+    b"<guid>https://example.com/episode.html</guid></item>"
+)
+
+
+def _run(code: str) -> Any:
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, check=True, text=True)
+    return json.loads(result.stdout)
+
+
+def test_import_is_lazy():
+    result = _run(
+        f"import json, sys\nimport podryk\nprint(json.dumps([m for m in {_HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+
+    assert result == []
+
+
+def test_import_is_fast():
+    result = _run(
+        "import json, sys\n"
+        "before = set(sys.modules)\n"
+        "import podryk\n"
+        "print(json.dumps(sorted(set(sys.modules) - before)))"
+    )
+
+    # Independent of the speed of the machine: importing the package runs its own module and imports nothing else,
+    # not even `typing`, which alone takes about as long as the bare interpreter start-up
+    assert result == ["podryk"]
+
+
+def test_features_are_imported_on_first_use():
+    result = _run(
+        "import json, sys\n"
+        "from podryk import Podcast\n"
+        f"print(json.dumps([m for m in {_FEATURE_MODULES!r} if m in sys.modules]))"
+    )
+
+    assert result == []
+
+
+def test_models_are_built_on_first_use():
+    result = _run(
+        "import json\n"
+        "from podryk import Podcast\n"
+        "deferred = not Podcast.__pydantic_complete__\n"
+        "from tests.utils.podcasts import make_podcast\n"
+        "make_podcast(1).to_feed()\n"
+        "print(json.dumps({'deferred': deferred, 'built': Podcast.__xml_serializer__ is not None}))"
+    )
+
+    assert result == {"deferred": True, "built": True}
+
+
+def test_models_are_built_on_first_parse():
+    result = _run(
+        "import json\n"
+        "from podryk import Episode\n"
+        "deferred = not Episode.__pydantic_complete__\n"
+        f"episode = Episode.from_xml({_ITEM!r})\n"
+        "print(json.dumps({'deferred': deferred, 'title': episode.title}))"
+    )
+
+    assert result == {"deferred": True, "title": "Episode title"}
+
+
+def test_models_are_built_once_by_concurrent_threads():
+    result = _run(
+        "import json\n"
+        "from concurrent.futures import ThreadPoolExecutor\n"
+        "from threading import Barrier\n"
+        "from podryk import CompactEpisode\n"
+        "episode = CompactEpisode(\n"
+        "    title='Episode title', guid='episode-1', guid_is_permalink=False,\n"
+        "    enclosure_url='https://example.com/audio.mp3', enclosure_length=30000, enclosure_type='audio/mpeg',\n"
+        "    chapters=((0.0, 'Intro', None, None),),\n"
+        ")\n"
+        "barrier = Barrier(8)\n"
+        "def render(_):\n"
+        "    instance = episode.to_episode()\n"
+        "    barrier.wait()\n"
+        "    return instance.to_xml_tree().tag\n"
+        "with ThreadPoolExecutor(8) as executor:\n"
+        "    print(json.dumps(list(executor.map(render, range(8)))))"
+    )
+
+    assert result == ["item"] * 8
+
+
+def test_warmup():
+    podryk.warmup()
+
+    pending = list(XmlModel.__subclasses__())
+    while pending:
+        model = pending.pop()
+        pending.extend(model.__subclasses__())
+        assert model.__pydantic_complete__, model
+        assert model.__xml_serializer__ is not None, model
+
+    assert set(podryk.__all__) <= set(dir(podryk))
@@ -0,0 +1,56 @@
+import json
+from datetime import timedelta
+from uuid import UUID
+
+import pytest
+from pydantic import ValidationError
+
+from podryk import Podcast, PodcastCategory, episodes_from_json, iter_episodes_json_lines
+
+from .utils.podcasts import episode_data, podcast_data
+
+
+def test_podcast_from_json():
+    data = podcast_data(1, guid="ead4c236-bf58-58c6-a2c6-a6b28d128cb6", categories=["TECHNOLOGY", ["Arts", "Books"]])
+
+    podcast = Podcast.model_validate_json(json.dumps(data).encode())
+
+    assert podcast == Podcast.model_validate(data)
+    assert podcast.guid == UUID("ead4c236-bf58-58c6-a2c6-a6b28d128cb6")
+    assert podcast.categories == [PodcastCategory.TECHNOLOGY, PodcastCategory.BOOKS]
+    assert podcast.episodes[0].duration == timedelta(seconds=60)
+    assert podcast.episodes[0].chapters[0].start == timedelta(seconds=10)
+
+
+def test_unknown_category_name():
+    with pytest.raises(ValidationError, match="Unknown podcast category: SPACE"):
+        Podcast.model_validate({"categories": ["SPACE"]})
+
+
+def test_episodes_from_json():
+    episodes = episodes_from_json(json.dumps([episode_data(1), episode_data(2)]))
+    assert [episode.title for episode in episodes] == ["Episode 1", "Episode 2"]
+    assert episodes[1].duration == timedelta(seconds=120)
+
+
+def test_iter_episodes_json_lines(tmp_path):
+    content = b"\n".join(json.dumps(episode_data(number)).encode() for number in range(1, 4)) + b"\n\n"
+    path = tmp_path / "episodes.jsonl"
+    path.write_bytes(content)
+
+    with open(path, "rb") as file:
+        for source in (content, path, str(path), file):
+            assert [episode.title for episode in iter_episodes_json_lines(source)] == [
+                "Episode 1",
+                "Episode 2",
+                "Episode 3",
+            ]
+
+
+def test_iter_episodes_json_lines_is_incremental():
+    content = json.dumps(episode_data(1)).encode() + b"\n{invalid\n"
+    episodes = iter_episodes_json_lines(content)
+
+    assert next(episodes).title == "Episode 1"
+    with pytest.raises(ValidationError):
+        next(episodes)
@@ -0,0 +1,67 @@
+import pytest
+from lxml import etree
+
+from podryk import EpisodeTable, MemoryFragmentCache
+from podryk.models.namespaces import NAMESPACES
+
+from .utils.podcasts import episode_columns, make_podcast
+
+
+def _content(feed: bytes) -> list[tuple]:
+    """Elements with their qualified names, attributes and text, independent of the namespace declarations."""
+    return [(element.tag, dict(element.attrib), element.text) for element in etree.fromstring(feed).iter()]
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_only_used_namespaces_are_declared(compiled: bool):
+    podcast = make_podcast(3)
+    full = podcast.to_feed(compiled=compiled)
+    minimal = podcast.to_feed(compiled=compiled, minimal_namespaces=True)
+
+    assert etree.fromstring(minimal).nsmap == {
+        prefix: NAMESPACES[prefix] for prefix in ("itunes", "podcast", "atom", "psc")
+    }
+    assert b"xmlns:" not in minimal.split(b"<channel>")[1]
+    assert _content(minimal) == _content(full)
+    assert len(minimal) < len(full)
+
+
+def test_unused_episode_namespaces_are_left_out():
+    podcast = make_podcast(2)
+    podcast = podcast.model_copy(
+        update={"episodes": [episode.model_copy(update={"chapters": None}) for episode in podcast.episodes]}
+    )
+
+    assert "psc" not in etree.fromstring(podcast.to_feed(minimal_namespaces=True)).nsmap
+
+
+def test_namespace_used_by_a_single_episode():
+    podcast = make_podcast(3)
+    episodes = [episode.model_copy(update={"chapters": None}) for episode in podcast.episodes[:2]]
+    podcast = podcast.model_copy(update={"episodes": [*episodes, podcast.episodes[2]]})
+
+    minimal = podcast.to_feed(minimal_namespaces=True)
+    assert "psc" in etree.fromstring(minimal).nsmap
+    assert minimal.count(b"xmlns:psc") == 1
+
+
+def test_chunks_and_cache_match_feed():
+    podcast = make_podcast(3)
+    expected = podcast.to_feed(minimal_namespaces=True)
+    cache = MemoryFragmentCache()
+
+    assert b"".join(podcast.iter_feed_chunks(minimal_namespaces=True)) == expected
+    assert podcast.to_feed(cache=cache, minimal_namespaces=True) == expected
+    # Fragments don't depend on the declared namespaces and are shared with full renders
+    assert podcast.to_feed(cache=cache) == podcast.to_feed()
+    assert podcast.to_feed(cache=cache, minimal_namespaces=True) == expected
+
+
+def test_episode_table():
+    podcast = make_podcast(3)
+    episodes = [episode.model_copy(update={"transcripts": None, "chapters": None}) for episode in podcast.episodes]
+    table = podcast.model_validate({**dict(podcast), "episodes": EpisodeTable(episode_columns(episodes))})
+
+    minimal = table.to_feed(minimal_namespaces=True)
+    assert set(etree.fromstring(minimal).nsmap) == {"itunes", "podcast", "atom"}
+    assert _content(minimal) == _content(table.to_feed())
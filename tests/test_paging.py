@@ -0,0 +1,77 @@
+import re
+
+import pytest
+
+from .utils.podcasts import make_podcast
+
+ARCHIVE_URL = "https://example.com/feed-{page}.rss"
+
+
+def _titles(feed: bytes) -> list[int]:
+    return [int(number) for number in re.findall(rb"<title>Episode (\d+) ", feed)]
+
+
+def _links(feed: bytes) -> list[tuple[str, str]]:
+    return [
+        (rel.decode(), href.decode()) for href, rel in re.findall(rb'<atom:link href="([^"]+)" rel="([^"]+)"', feed)
+    ]
+
+
+def test_pages():
+    pages = list(make_podcast(7).iter_pages(page_size=3, archive_url=ARCHIVE_URL))
+
+    assert [page.number for page in pages] == [None, 2, 1]
+    assert [page.archive for page in pages] == [False, True, True]
+    assert [_titles(page.feed) for page in pages] == [[7], [6, 5, 4], [3, 2, 1]]
+
+    current, newest_archive, oldest_archive = pages
+    assert current.url == "https://example.com/feed.rss"
+    assert _links(current.feed) == [
+        ("self", "https://example.com/feed.rss"),
+        ("prev-archive", "https://example.com/feed-2.rss"),
+        ("next", "https://example.com/feed-2.rss"),
+    ]
+    assert _links(newest_archive.feed) == [
+        ("self", "https://example.com/feed-2.rss"),
+        ("current", "https://example.com/feed.rss"),
+        ("prev-archive", "https://example.com/feed-1.rss"),
+        ("next", "https://example.com/feed-1.rss"),
+    ]
+    assert _links(oldest_archive.feed) == [
+        ("self", "https://example.com/feed-1.rss"),
+        ("current", "https://example.com/feed.rss"),
+    ]
+
+
+def test_single_page():
+    podcast = make_podcast(3)
+    (page,) = podcast.iter_pages(page_size=3, archive_url=ARCHIVE_URL)
+
+    assert page.feed == podcast.model_copy(update={"episodes": podcast.episodes[::-1]}).to_feed()
+
+
+def test_archives_dont_change():
+    before = {page.number: page.feed for page in make_podcast(7).iter_pages(page_size=3, archive_url=ARCHIVE_URL)}
+    after = {page.number: page.feed for page in make_podcast(10).iter_pages(page_size=3, archive_url=ARCHIVE_URL)}
+
+    assert before[1] == after[1]
+    assert before[2] == after[2]
+    assert _titles(after[3]) == [9, 8, 7]
+
+
+def test_skip_published_archives():
+    pages = make_podcast(10).iter_pages(page_size=3, archive_url=ARCHIVE_URL, published_archives=2)
+    assert [page.number for page in pages] == [None, 3]
+
+
+def test_invalid_page_size():
+    with pytest.raises(ValueError):
+        list(make_podcast(1).iter_pages(page_size=0, archive_url=ARCHIVE_URL))
+
+
+def test_compiled_pages():
+    podcast = make_podcast(7)
+    pages = podcast.iter_pages(page_size=3, archive_url=ARCHIVE_URL)
+    compiled_pages = podcast.iter_pages(page_size=3, archive_url=ARCHIVE_URL, compiled=True)
+
+    assert [page.feed for page in pages] == [page.feed for page in compiled_pages]
@@ -0,0 +1,182 @@
+import textwrap
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from pydantic import ValidationError
+
+from podryk import Podcast, PodcastCategory
+from podryk.models.namespaces import NAMESPACES
+from podryk.parsing import LazyEpisodes, iter_items
+
+from .utils.podcasts import make_podcast
+
+EXTERNAL_FEED = textwrap.dedent(
+    """\
+    <?xml version="1.0" encoding="UTF-8"?>
+    <rss version="2.0" xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd"
+         xmlns:atom="http://www.w3.org/2005/Atom" xmlns:psc="http://podlove.org/simple-chapters"
+         xmlns:podcast="https://podcastindex.org/namespace/1.0">
+      <channel>
+        <title>Hiking Treks</title>
+        <link>https://www.apple.com/itunes/podcasts/</link>
+        <language>en-us</language>
+        <generator>Some other host</generator>
+        <atom:link href="https://pubsubhubbub.appspot.com/" rel="hub"/>
+        <atom:link href="https://example.com/feed.rss" rel="self" type="application/rss+xml"/>
+        <itunes:explicit>clean</itunes:explicit>
+        <itunes:category text="Sports">
+          <itunes:category text="Wilderness"/>
+          <itunes:category text="Unknown"/>
+        </itunes:category>
+        <itunes:category text="Unknown"/>
+        <description>Love to get outdoors?</description>
+        <item>
+          <title>Trailer</title>
+          <enclosure url="https://example.com/trailer.mp3" length="498537" type="audio/mpeg"/>
+          <pubDate>Tue, 08 Jan 2019 01:15:00 GMT</pubDate>
+          <itunes:duration>1:02:03</itunes:duration>
+          <itunes:episodeType>trailer</itunes:episodeType>
+          <podcast:transcript url="https://example.com/trailer.vtt" type="text/vtt" rel="captions"/>
+          <psc:chapters version="1.2">
+            <psc:chapter start="00:01:30.500" title="Intro" href="https://example.com"/>
+          </psc:chapters>
+        </item>
+        <item>
+          <title>Mt. Hood</title>
+          <guid>https://example.com/mt-hood</guid>
+          <enclosure url="https://example.com/mthood.m4a" length="8727310" type="audio/mp4"/>
+          <itunes:duration>1024</itunes:duration>
+          <itunes:block>Yes</itunes:block>
+        </item>
+      </channel>
+    </rss>
+    """
+).encode()
+
+
+def test_round_trip():
+    podcast = make_podcast(5).model_copy(
+        update={"categories": [PodcastCategory.WILDERNESS, PodcastCategory.TECHNOLOGY]}
+    )
+    parsed = Podcast.from_feed(podcast.to_feed())
+
+    assert parsed == podcast
+    assert parsed.to_feed() == podcast.to_feed()
+
+
+def test_external_feed():
+    podcast = Podcast.from_feed(EXTERNAL_FEED)
+
+    assert podcast.canonical_link == "https://example.com/feed.rss"
+    assert podcast.links == []
+    assert podcast.explicit is False
+    assert podcast.categories == [PodcastCategory.WILDERNESS, PodcastCategory.SPORTS]
+
+    trailer, mt_hood = podcast.episodes
+    assert trailer.guid.guid == "https://example.com/trailer.mp3"
+    assert trailer.guid.is_permalink is False
+    assert trailer.publication_date == datetime(2019, 1, 8, 1, 15, tzinfo=UTC)
+    assert trailer.duration == timedelta(hours=1, minutes=2, seconds=3)
+    assert trailer.transcripts[0].url == "https://example.com/trailer.vtt"
+    assert trailer.chapters[0].start == timedelta(minutes=1, seconds=30, milliseconds=500)
+    assert trailer.chapters[0].href == "https://example.com"
+
+    assert mt_hood.guid.guid == "https://example.com/mt-hood"
+    assert mt_hood.guid.is_permalink is None
+    assert mt_hood.duration == timedelta(seconds=1024)
+    assert mt_hood.block is True
+
+
+def test_date_without_time_zone_is_utc():
+    feed = EXTERNAL_FEED.replace(b"01:15:00 GMT", b"01:15:00 -0000")
+    trailer = Podcast.from_feed(feed).episodes[0]
+    assert trailer.publication_date == datetime(2019, 1, 8, 1, 15, tzinfo=UTC)
+
+
+@pytest.mark.parametrize(
+    ("original", "invalid", "field"),
+    [
+        (b"<itunes:duration>1024<", b"<itunes:duration>17 min<", "duration"),
+        (b"Tue, 08 Jan 2019 01:15:00 GMT", b"yesterday", "publication_date"),
+    ],
+)
+def test_invalid_values_fail_validation(original: bytes, invalid: bytes, field: str):
+    feed = EXTERNAL_FEED.replace(original, invalid)
+    with pytest.raises(ValidationError, match=field):
+        Podcast.from_feed(feed)
+
+
+def test_from_file(tmp_path):
+    path = tmp_path / "feed.rss"
+    path.write_bytes(make_podcast(2).to_feed())
+
+    assert Podcast.from_feed(path) == make_podcast(2)
+    with path.open("rb") as file:
+        assert Podcast.from_feed(file) == make_podcast(2)
+
+
+def test_items_are_discarded():
+    elements = list(iter_items(make_podcast(20).to_feed()))
+
+    assert [element.tag for element in elements] == ["item"] * 20 + ["channel"]
+    assert elements[-1].find("item") is None
+    assert elements[-1].find("title") is not None
+
+
+class TestLazyParsing:
+    def test_episodes_are_parsed_on_access(self):
+        podcast = make_podcast(5)
+        parsed = Podcast.from_feed(podcast.to_feed(), lazy=True)
+
+        assert isinstance(parsed.episodes, LazyEpisodes)
+        assert len(parsed.episodes) == 5
+        assert parsed.episodes.loaded == 1
+        assert parsed.title == podcast.title
+
+        assert parsed.episodes[3] == podcast.episodes[3]
+        assert parsed.episodes.loaded == 2
+        assert parsed.episodes[-2:] == podcast.episodes[-2:]
+
+    def test_same_result_as_eager_parsing(self):
+        parsed = Podcast.from_feed(EXTERNAL_FEED, lazy=True)
+        assert parsed.model_copy(update={"episodes": parsed.episodes.load()}) == Podcast.from_feed(EXTERNAL_FEED)
+
+    def test_namespaces_declared_on_channel(self):
+        itunes = f'xmlns:itunes="{NAMESPACES["itunes"]}"'.encode()
+        feed = make_podcast(3).to_feed(minimal_namespaces=True)
+        feed = feed.replace(b" " + itunes, b"", 1).replace(b"<channel>", b"<channel " + itunes + b">", 1)
+        assert b"<itunes:duration>" in feed.split(b"<item>")[2]
+
+        parsed = Podcast.from_feed(feed, lazy=True)
+        assert parsed.episodes.load() == Podcast.from_feed(feed).episodes
+
+    def test_render_lazy_podcast(self, tmp_path):
+        path = tmp_path / "feed.rss"
+        path.write_bytes(make_podcast(3).to_feed())
+        parsed = Podcast.from_feed(path, lazy=True)
+
+        assert parsed.to_feed() == make_podcast(3).to_feed()
+        assert parsed.fingerprint() == make_podcast(3).fingerprint()
+
+    def test_close_file(self, tmp_path):
+        path = tmp_path / "feed.rss"
+        path.write_bytes(make_podcast(3).to_feed())
+
+        with Podcast.from_feed(path, lazy=True).episodes as episodes:
+            episode = episodes[1]
+        assert episodes.closed
+
+        # Loaded episodes are kept
+        assert episodes[1] is episode
+        with pytest.raises(ValueError, match="closed feed"):
+            episodes[2]
+
+    def test_item_markup_in_cdata(self):
+        podcast = make_podcast(2)
+        podcast.episodes[0] = podcast.episodes[0].model_copy(
+            update={"description": "<item><title>Not an item</title></item> <!-- </item> -->"}
+        )
+        parsed = Podcast.from_feed(podcast.to_feed(), lazy=True)
+
+        assert len(parsed.episodes) == 2
+        assert parsed.episodes.load() == podcast.episodes
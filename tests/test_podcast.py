@@ -1,7 +1,19 @@
+import pytest
+from pydantic import ValidationError
 from syrupy import SnapshotAssertion
 
-from podryk import Enclosure, Episode, Guid, Podcast, PodcastCategory
+from podryk import (
+    CompactEpisodes,
+    Enclosure,
+    Episode,
+    EpisodeCollection,
+    EpisodeTable,
+    Guid,
+    Podcast,
+    PodcastCategory,
+)
 
+from .utils.podcasts import episode_columns, make_podcast
 from .utils.xml_util import to_xml
 
 
@@ -54,3 +66,58 @@ def test_full_podcast(snapshot: SnapshotAssertion):
     )
 
     assert to_xml(podcast) == snapshot
+
+
+def test_category_lookup():
+    assert PodcastCategory.from_names("Arts", "Books") is PodcastCategory.BOOKS
+    assert PodcastCategory.from_names("Technology") is PodcastCategory.TECHNOLOGY
+    with pytest.raises(ValueError, match="Unknown podcast category: Arts / Spaceships"):
+        PodcastCategory.from_names("Arts", "Spaceships")
+
+    assert PodcastCategory.BOOKS.parent is PodcastCategory.ARTS
+    assert PodcastCategory.ARTS.parent is None
+    assert PodcastCategory.ARTS.children[:2] == (PodcastCategory.BOOKS, PodcastCategory.DESIGN)
+    assert PodcastCategory.TECHNOLOGY.children == ()
+
+
+def test_category_names_are_accepted():
+    podcast = make_podcast(1)
+    data = {**dict(podcast), "categories": ["TECHNOLOGY", "Arts", ("Arts", "Books")]}
+
+    categories = Podcast.model_validate(data).categories
+    assert categories == [PodcastCategory.TECHNOLOGY, PodcastCategory.ARTS, PodcastCategory.BOOKS]
+
+
+def test_category_tree_deduplicates_sub_categories():
+    podcast = make_podcast(1)
+    duplicated = podcast.model_copy(
+        update={"categories": [PodcastCategory.BOOKS, PodcastCategory.ARTS, PodcastCategory.BOOKS]}
+    )
+    single = podcast.model_copy(update={"categories": [PodcastCategory.BOOKS]})
+
+    assert to_xml(duplicated) == to_xml(single)
+    assert to_xml(duplicated).count('text="Books"') == 1
+    # Trees are shared between podcasts with the same categories
+    assert duplicated._categories[0] is duplicated.model_copy()._categories[0]
+    with pytest.raises(ValidationError):
+        duplicated._categories[0].text = "Other"
+
+
+@pytest.mark.parametrize("container", ["list", "collection", "compact", "table", "lazy"])
+def test_episode_containers_are_serialized_as_lists(container: str):
+    podcast = make_podcast(3)
+    episodes = [episode.model_copy(update={"transcripts": None, "chapters": None}) for episode in podcast.episodes]
+    podcast = podcast.model_copy(update={"episodes": episodes})
+    containers = {
+        "list": lambda: episodes,
+        "collection": lambda: EpisodeCollection(episodes),
+        "compact": lambda: CompactEpisodes(episodes),
+        "table": lambda: EpisodeTable(episode_columns(episodes)),
+        "lazy": lambda: Podcast.from_feed(podcast.to_feed(), lazy=True).episodes,
+    }
+    converted = Podcast.model_validate({**dict(podcast), "episodes": containers[container]()})
+    listed = converted.model_copy(update={"episodes": list(converted.episodes)})
+
+    # The models warn about URL fields anyway, since `URL` values are kept as strings
+    assert converted.model_dump_json(warnings=False) == listed.model_dump_json(warnings=False)
+    assert converted.model_dump(warnings=False) == listed.model_dump(warnings=False)
@@ -0,0 +1,25 @@
+import io
+
+import pytest
+
+from .utils.podcasts import make_podcast
+
+
+@pytest.mark.parametrize("episode_count", [1, 2, 25])
+def test_chunks_match_feed(episode_count: int):
+    podcast = make_podcast(episode_count)
+    assert b"".join(podcast.iter_feed_chunks()) == podcast.to_feed()
+
+
+def test_chunks_per_episode():
+    chunks = list(make_podcast(3).iter_feed_chunks())
+    # header, three items with two separators, footer
+    assert len(chunks) == 7
+    assert chunks[1].startswith(b"<item>") and chunks[1].endswith(b"</item>")
+
+
+def test_write_feed():
+    podcast = make_podcast(3)
+    file = io.BytesIO()
+    podcast.write_feed(file)
+    assert file.getvalue() == podcast.to_feed()
@@ -1,8 +1,11 @@
 import uuid
 
+import pytest
+from pydantic import ValidationError
 from syrupy import SnapshotAssertion
 
 from podryk.models.episode import Guid
+from podryk.models.sub_types import Enclosure, Transcript
 
 from .utils.xml_util import to_xml
 
@@ -21,4 +24,22 @@ class TestGuid:
 
     def test_uuid_force_permalink(self, snapshot: SnapshotAssertion):
         guid = Guid(guid=uuid.UUID('{12345678-1234-5678-1234-567812345678}'), is_permalink=True)
-        assert to_xml(guid) == snapshot
\ No newline at end of file
+        assert to_xml(guid) == snapshot
+
+
+# noinspection PyMethodMayBeStatic
+class TestMediaTypeInference:
+    def test_enclosure_type_from_url(self):
+        enclosure = Enclosure(url="https://example.com/episode.m4a?token=abc", length=1)
+        assert enclosure.type == "audio/mp4"
+
+    def test_transcript_type_from_url(self):
+        assert Transcript(url="https://example.com/episode.vtt").type == "text/vtt"
+
+    def test_explicit_type(self):
+        enclosure = Enclosure(url="https://example.com/episode.mp3", length=1, type="audio/mp4")
+        assert enclosure.type == "audio/mp4"
+
+    def test_unknown_extension(self):
+        with pytest.raises(ValidationError, match="type\n  Field required"):
+            Enclosure(url="https://example.com/episode", length=1)
@@ -0,0 +1,104 @@
+from datetime import timedelta
+
+import pytest
+
+from podryk import Episode, EpisodeTable, EpisodeType
+
+from .utils.podcasts import episode_columns, make_podcast
+
+
+def _expected(episode_count: int):
+    podcast = make_podcast(episode_count)
+    episodes = [
+        episode.model_copy(update={"transcripts": None, "chapters": None, "episode_number": number, "type": "full"})
+        for number, episode in enumerate(podcast.episodes, start=1)
+    ]
+    return podcast, episodes
+
+
+def test_items_match_episodes():
+    _, episodes = _expected(3)
+    table = EpisodeTable(episode_columns(episodes))
+
+    assert len(table) == 3
+    assert table[1] == episodes[1].model_copy(update={"type": EpisodeType.FULL})
+    assert table[-1].enclosure.type == "audio/mpeg"
+    assert table[1].duration == timedelta(minutes=2)
+
+
+def test_feed_matches_episodes(monkeypatch):
+    podcast, episodes = _expected(25)
+    expected = podcast.model_copy(update={"episodes": episodes}).to_feed()
+
+    table = podcast.model_validate({**dict(podcast), "episodes": EpisodeTable(episode_columns(episodes))})
+    assert isinstance(table.episodes, EpisodeTable)
+
+    constructed = []
+    construct = Episode.model_construct
+
+    def counting_construct(**values):
+        constructed.append(values)
+        return construct(**values)
+
+    monkeypatch.setattr(Episode, "model_construct", counting_construct)
+
+    assert table.to_feed() == expected
+    assert table.to_feed(compiled=True) == expected
+    assert table.last_modified == episodes[-1].publication_date
+    # Per render, only the first episode is built to render the channel around the items
+    assert len(constructed) == 2
+
+
+def test_columns_are_validated():
+    _, episodes = _expected(3)
+    columns = episode_columns(episodes)
+    columns["duration"][1] = -5
+    columns["enclosure_url"][2] = "https://example.com/2.unknown"
+    columns["guid"][2] = columns["guid"][0]
+
+    with pytest.raises(ValueError) as error:
+        EpisodeTable(columns)
+
+    assert str(error.value) == (
+        "Invalid episode table (enclosure_type[2]: unknown type; duration[1]: must be positive; "
+        "guid[2]: duplicate episode-1)"
+    )
+
+
+def test_column_types_are_checked():
+    _, episodes = _expected(2)
+    columns = {
+        **episode_columns(episodes),
+        "guid_is_permalink": [None, "no"],
+        "enclosure_length": [True, 1],
+        "link": ["not a url", None],
+        "image": [None, "ftp://example.com/image.png"],
+        "duration": ["long", None],
+        "explicit": ["maybe", None],
+        "block": [None, 1],
+        "season_number": [True, None],
+        "type": ["bogus", None],
+    }
+    columns["title"][1] = 1
+    columns["guid"][1] = 2
+
+    with pytest.raises(ValueError) as error:
+        EpisodeTable(columns)
+
+    assert str(error.value) == (
+        "Invalid episode table (title[1]: must be a string; guid[1]: must be a string or UUID; guid_is_permalink[1]: must be a boolean; "
+        "enclosure_length[0]: must be an integer; link[0]: must be an HTTP(S) URL; image[1]: must be an HTTP(S) URL; "
+        "duration[0]: must be positive; explicit[0]: must be a boolean; block[1]: must be a boolean; "
+        "season_number[0]: must be a positive integer; type[0]: unknown episode type)"
+    )
+
+
+def test_invalid_columns():
+    _, episodes = _expected(2)
+
+    with pytest.raises(ValueError, match="Unknown episode columns: chapters"):
+        EpisodeTable({**episode_columns(episodes), "chapters": [None, None]})
+    with pytest.raises(ValueError, match="Missing episode columns: guid"):
+        EpisodeTable({name: column for name, column in episode_columns(episodes).items() if name != "guid"})
+    with pytest.raises(ValueError, match="differ in length"):
+        EpisodeTable({**episode_columns(episodes), "title": ["Only one title"]})
@@ -0,0 +1,92 @@
+from unittest import mock
+
+import pytest
+
+from podryk import DroppedEpisode, EpisodeTable, MemoryFragmentCache
+
+from .utils.podcasts import episode_columns, make_podcast
+
+
+def _shuffled(episode_count: int):
+    """A podcast whose episodes aren't sorted by publication date."""
+    podcast = make_podcast(episode_count)
+    episodes = podcast.episodes[1::2] + podcast.episodes[::2]
+    return podcast.model_copy(update={"episodes": episodes})
+
+
+def test_keeps_newest_episodes_that_fit():
+    podcast = _shuffled(10)
+    # Newest first: episodes 10, 9, 8, ...
+    newest = [episode for episode in podcast.episodes if episode.guid.guid in ("episode-9", "episode-10")]
+    expected = podcast.model_copy(update={"episodes": newest})
+    max_bytes = len(expected.to_feed()) + 10
+
+    trimmed = podcast.to_trimmed_feed(max_bytes)
+    assert trimmed.feed == expected.to_feed()
+    assert len(trimmed.feed) <= max_bytes
+    assert [dropped.guid for dropped in trimmed.dropped_episodes] == [
+        "episode-2",
+        "episode-4",
+        "episode-6",
+        "episode-8",
+        "episode-1",
+        "episode-3",
+        "episode-5",
+        "episode-7",
+    ]
+    assert trimmed.dropped_episodes[0] == DroppedEpisode(index=0, guid="episode-2")
+    assert not trimmed.complete
+    assert podcast.to_feed(max_bytes=max_bytes) == trimmed.feed
+
+
+def test_complete_feed():
+    podcast = _shuffled(3)
+    feed = podcast.to_feed()
+
+    trimmed = podcast.to_trimmed_feed(len(feed))
+    assert trimmed.complete
+    assert trimmed.feed == feed
+
+
+def test_too_small():
+    podcast = make_podcast(3)
+    with pytest.raises(ValueError, match="doesn't fit into 1000 bytes"):
+        podcast.to_trimmed_feed(1000)
+
+
+def test_episodes_are_rendered_once():
+    podcast = make_podcast(10)
+    cache = MemoryFragmentCache()
+    with mock.patch.object(cache, "set", wraps=cache.set) as cache_set:
+        trimmed = podcast.to_trimmed_feed(len(podcast.to_feed()) // 2, cache=cache)
+
+    # The kept episodes and the first one that didn't fit
+    assert cache_set.call_count == 10 - len(trimmed.dropped_episodes) + 1
+
+
+def test_minimal_namespaces():
+    podcast = make_podcast(2)
+    newest = podcast.episodes[1]
+    episodes = [newest.model_copy(update={"chapters": None}), podcast.episodes[0]]
+    podcast = podcast.model_copy(update={"episodes": episodes})
+    expected = podcast.model_copy(update={"episodes": episodes[:1]}).to_feed(minimal_namespaces=True)
+
+    # The size of the declarations of namespaces that only the kept episodes use is exact
+    trimmed = podcast.to_trimmed_feed(len(expected), minimal_namespaces=True)
+    assert trimmed.feed == expected
+    assert b"xmlns:psc" not in trimmed.feed
+
+    complete = podcast.to_feed(minimal_namespaces=True)
+    assert podcast.to_trimmed_feed(len(complete), minimal_namespaces=True).feed == complete
+    assert not podcast.to_trimmed_feed(len(complete) - 1, minimal_namespaces=True).complete
+
+
+def test_episode_table():
+    podcast = make_podcast(5)
+    episodes = [episode.model_copy(update={"transcripts": None, "chapters": None}) for episode in podcast.episodes]
+    table = podcast.model_validate({**dict(podcast), "episodes": EpisodeTable(episode_columns(episodes))})
+    expected = table.model_copy(update={"episodes": table.episodes[3:]}).to_feed()
+
+    trimmed = table.to_trimmed_feed(len(expected))
+    assert trimmed.feed == expected
+    assert [dropped.index for dropped in trimmed.dropped_episodes] == [0, 1, 2]
@@ -0,0 +1,110 @@
+import timeit
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from podryk import Chapter, Enclosure, Episode, Guid, Podcast
+
+from .utils.podcasts import podcast_data
+
+
+def test_all_valid():
+    result = Podcast.validate_partial(podcast_data(3))
+
+    assert result.ok
+    assert result.invalid_episodes == []
+    assert result.podcast.to_feed() == Podcast.model_validate(podcast_data(3)).to_feed()
+
+
+def test_invalid_episodes_are_left_out():
+    data = podcast_data(4)
+    data["episodes"][1]["description"] = "x" * 4001
+    data["episodes"][3]["enclosure"] = {"url": "https://example.com/3.mp3", "length": 1, "type": "unknown/type"}
+
+    result = Podcast.validate_partial(data)
+
+    assert not result.ok
+    assert [invalid.index for invalid in result.invalid_episodes] == [1, 3]
+    assert [invalid.guid for invalid in result.invalid_episodes] == [
+        str(data["episodes"][1]["guid"]["guid"]),
+        str(data["episodes"][3]["guid"]["guid"]),
+    ]
+    assert result.invalid_episodes[0].errors[0]["loc"] == ("description",)
+    assert result.invalid_episodes[1].errors[0]["loc"] == ("enclosure", "type")
+
+    valid_episodes = [data["episodes"][0], data["episodes"][2]]
+    assert [episode.title for episode in result.podcast.episodes] == [episode["title"] for episode in valid_episodes]
+
+
+def test_guid_from_raw_data():
+    data = podcast_data(2)
+    data["episodes"][0] = {"title": "Missing enclosure", "guid": {"guid": "missing-enclosure"}}
+
+    result = Podcast.validate_partial(data)
+
+    assert result.invalid_episodes[0].guid == "missing-enclosure"
+    assert len(result.podcast.episodes) == 1
+
+
+def test_invalid_podcast_fields_raise():
+    data = podcast_data(1)
+    data["language"] = "invalid language"
+
+    with pytest.raises(ValidationError):
+        Podcast.validate_partial(data)
+
+
+def test_duplicate_episodes_are_rejected():
+    data = podcast_data(4)
+    data["episodes"][2]["guid"] = data["episodes"][0]["guid"]
+    data["episodes"][3]["enclosure"] = data["episodes"][1]["enclosure"]
+
+    with pytest.raises(ValidationError) as error:
+        Podcast.model_validate(data)
+
+    message = str(error.value)
+    assert f"episode 2: Duplicate GUID: {data['episodes'][0]['guid']['guid']}" in message
+    assert f"episode 3: Duplicate enclosure URL: {data['episodes'][1]['enclosure']['url']}" in message
+
+
+def test_duplicate_episodes_are_reported():
+    data = podcast_data(3)
+    data["episodes"][2]["guid"] = data["episodes"][0]["guid"]
+
+    result = Podcast.validate_partial(data)
+
+    assert [invalid.index for invalid in result.invalid_episodes] == [2]
+    assert result.invalid_episodes[0].errors[0]["type"] == "duplicate"
+    assert result.invalid_episodes[0].errors[0]["loc"] == ("guid", "guid")
+    assert len(result.podcast.episodes) == 2
+
+
+def test_validation_is_faster_than_construction():
+    data = podcast_data(500)
+
+    def construct() -> Podcast:
+        # The least work a Python path that skips validation has to do, without any conversions or defaults logic
+        return Podcast.model_construct(**{**data, "episodes": [_construct_episode(item) for item in data["episodes"]]})
+
+    validate = min(timeit.repeat(lambda: Podcast.model_validate(data), number=3, repeat=5))
+    constructed = min(timeit.repeat(construct, number=3, repeat=5))
+
+    # Re-validating already validated data is the cheap path (see "Trusted data" in the README)
+    assert validate < constructed
+
+
+def _construct_episode(data: dict[str, Any]) -> Episode:
+    return Episode.model_construct(
+        **{
+            **data,
+            "guid": Guid.model_construct(**{"is_permalink": False, **data["guid"]}),
+            "enclosure": Enclosure.model_construct(**data["enclosure"]),
+            "duration": timedelta(seconds=data["duration"]),
+            "chapters": [
+                Chapter.model_construct(**{**chapter, "start": timedelta(seconds=chapter["start"])})
+                for chapter in data["chapters"]
+            ],
+        }
+    )
@@ -0,0 +1,95 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from podryk import Chapter, Episode, Transcript
+from podryk.models import validators
+from podryk.models.validators import (
+    MEDIA_TYPES,
+    Flyweights,
+    _is_http_url_string,
+    intern_string,
+    is_http_url,
+    is_media_type,
+    media_type_from_url,
+)
+
+from .utils.memory import allocated_per_item
+from .utils.podcasts import episode_data
+
+
+def test_media_types():
+    assert isinstance(MEDIA_TYPES, frozenset)
+    assert is_media_type("audio/mpeg")
+    assert not is_media_type("unknown/type")
+
+
+def test_http_url():
+    assert is_http_url("https://example.com/episode-1")
+    assert not is_http_url("episode-1")
+    assert not is_http_url(None)
+
+
+def test_http_url_is_memoized():
+    _is_http_url_string.cache_clear()
+
+    for _ in range(3):
+        assert is_http_url("https://example.com/memoized")
+
+    info = _is_http_url_string.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+
+
+def test_media_type_from_url():
+    assert media_type_from_url("https://example.com/episode.mp3") == "audio/mpeg"
+    assert media_type_from_url("https://example.com/EPISODE.M4A?token=mp3") == "audio/mp4"
+    assert media_type_from_url("https://example.com/episode") is None
+    assert media_type_from_url("https://example.com/episode.unknown") is None
+
+
+def test_intern_string():
+    first, second = b"audio/mpeg".decode(), b"audio/mpeg".decode()
+    assert first is not second
+    assert intern_string(first) is intern_string(second)
+    assert intern_string(None) is None
+
+
+def test_flyweights():
+    flyweights = Flyweights(max_size=2)
+    first = Transcript(url="https://example.com/1.vtt", language="en")
+
+    assert flyweights.share(first) is first
+    assert flyweights.share(Transcript(url="https://example.com/1.vtt", language="en")) is first
+    assert flyweights.share(Transcript(url="https://example.com/1.vtt", language="de")) is not first
+
+    with pytest.raises(ValidationError):
+        first.language = "de"
+
+    flyweights.share(Transcript(url="https://example.com/2.vtt"))
+    flyweights.share(Transcript(url="https://example.com/3.vtt"))
+    # Evicted
+    assert flyweights.share(Transcript(url="https://example.com/1.vtt", language="en")) is not first
+
+    chapter = Chapter(start=10, title="Intro")
+    assert flyweights.share(Chapter(start=10, title="Intro")) is not chapter
+    assert flyweights.share(chapter) is chapter
+
+
+def test_shared_values_benchmark(monkeypatch):
+    image = "https://cdn.example.com/show/artwork-3000x3000.jpg"
+    transcript = {"url": "https://cdn.example.com/show/transcript.vtt", "type": "text/vtt", "language": "en-us"}
+    lines = [json.dumps(episode_data(number, image=image, transcripts=[transcript])) for number in range(1000)]
+
+    episodes = [Episode.model_validate_json(line) for line in lines[:2]]
+    assert episodes[0].enclosure.type is episodes[1].enclosure.type
+    assert episodes[0].image is episodes[1].image
+    assert episodes[0].transcripts[0] is episodes[1].transcripts[0]
+
+    shared_size = allocated_per_item(lambda: [Episode.model_validate_json(line) for line in lines])
+    with monkeypatch.context() as patch:
+        patch.setattr(validators, "_shared", lambda value: value)
+        patch.setattr(Flyweights, "share", lambda self, instance: instance)
+        unshared_size = allocated_per_item(lambda: [Episode.model_validate_json(line) for line in lines])
+
+    assert shared_size < unshared_size * 0.9, f"{shared_size:.0f} vs. {unshared_size:.0f} bytes per episode"
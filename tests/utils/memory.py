@@ -0,0 +1,12 @@
+import tracemalloc
+from collections.abc import Callable, Sized
+
+
+def allocated_per_item(build: Callable[[], Sized]) -> float:
+    """The memory allocated by `build()` (and still held when it returns), per item of the result."""
+    tracemalloc.start()
+    try:
+        items = build()
+        return tracemalloc.get_traced_memory()[0] / len(items)
+    finally:
+        tracemalloc.stop()
@@ -0,0 +1,87 @@
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from podryk import (
+    Chapter,
+    Enclosure,
+    Episode,
+    Guid,
+    Podcast,
+    PodcastCategory,
+    TextRecord,
+    Transcript,
+)
+
+
+def make_podcast(episode_count: int) -> Podcast:
+    """A podcast with all commonly used fields and `episode_count` episodes with transcripts and chapters."""
+    return Podcast(
+        canonical_link="https://example.com/feed.rss",
+        title="Podcast title",
+        description="Podcast description\n  with <b>markup</b> & ümlauts",
+        link="https://example.com/episode.html",
+        language="en",
+        copyright="Copyright notice",
+        categories=[PodcastCategory.FILM_REVIEWS, PodcastCategory.TECHNOLOGY],
+        explicit=False,
+        image="https://example.com/podcast.png",
+        text_records=[TextRecord(purpose="verify", content="S6lpp-7ZCn8-dZfGc-OoyaG")],
+        episodes=[
+            Episode(
+                title=f"Episode {number} – “quoted” & escaped <title>",
+                guid=Guid(guid=f"episode-{number}"),
+                enclosure=Enclosure(
+                    url=f"https://example.com/{number}.mp3",
+                    length=30000 + number,
+                    type="audio/mpeg",
+                ),
+                publication_date=datetime(2020, 1, 1, tzinfo=UTC) + timedelta(days=number),
+                description=f"Line one\n    line two of episode {number}",
+                duration=timedelta(minutes=number),
+                transcripts=[Transcript(url=f"https://example.com/{number}.vtt", type="text/vtt")],
+                chapters=[Chapter(start=timedelta(seconds=number), title="Intro")],
+            )
+            for number in range(1, episode_count + 1)
+        ],
+    )
+
+
+def podcast_data(episode_count: int, **fields: Any) -> dict[str, Any]:
+    """The raw data of a podcast (as read from JSON) with `episode_count` episodes (see `episode_data()`)."""
+    return {
+        "canonical_link": "https://example.com/feed.rss",
+        "title": "Podcast title",
+        "description": "Podcast description",
+        "link": "https://example.com",
+        "language": "en",
+        "explicit": False,
+        "episodes": [episode_data(number) for number in range(1, episode_count + 1)],
+        **fields,
+    }
+
+
+def episode_data(number: int, **fields: Any) -> dict[str, Any]:
+    """The raw data of an episode (as read from JSON) with a duration and chapters. `fields` are added or replaced."""
+    return {
+        "title": f"Episode {number}",
+        "guid": {"guid": f"episode-{number}"},
+        "enclosure": {"url": f"https://example.com/{number}.mp3", "length": 30000, "type": "audio/mpeg"},
+        "duration": 60 * number,
+        "chapters": [{"start": 10, "title": "Intro"}],
+        **fields,
+    }
+
+
+def episode_columns(episodes: list[Episode]) -> dict[str, list]:
+    """The columns of an `EpisodeTable` with the values of `episodes` (without transcripts and chapters)."""
+    return {
+        "title": [episode.title for episode in episodes],
+        "guid": [episode.guid.guid for episode in episodes],
+        "enclosure_url": [episode.enclosure.url for episode in episodes],
+        "enclosure_length": [episode.enclosure.length for episode in episodes],
+        "publication_date": [episode.publication_date for episode in episodes],
+        "description": [episode.description for episode in episodes],
+        "duration": [episode.duration.total_seconds() for episode in episodes],
+        "episode_number": list(range(1, len(episodes) + 1)),
+        "type": ["full"] * len(episodes),
+    }
@@ -1,10 +1,18 @@
+from lxml import etree
 from pydantic_xml import BaseXmlModel
 
+from podryk.compiled import to_xml_tree
+
 
 def to_xml(model: BaseXmlModel) -> str:
-    return model.to_xml(
+    xml = model.to_xml(
         pretty_print=True,
         exclude_none=True,
         skip_empty=True,
         encoding="unicode",
     )
+
+    # Every serialized model doubles as a check that the compiled serializer produces identical output
+    assert etree.tostring(to_xml_tree(model), pretty_print=True, encoding="unicode") == xml
+
+    return xml